@@ -8,6 +8,8 @@ Uses the meeting data sample provided.
 
 import pymongo
 import random
+import bisect
+import itertools
 import time
 import logging
 import sys
@@ -110,6 +112,10 @@ class CDCDataGenerator:
             logger.error(f"❌ Failed to connect to MongoDB: {e}")
             raise
         
+        # Active-document counts and random picks all filter on is_deleted;
+        # creating an existing index is a no-op
+        self.collection.create_index("is_deleted")
+        
         # Data pools for generation
         self.cities = ["Hyderabad", "Singapore", "Tokyo", "New York", "London", "Dubai", "Sydney"]
         self.countries = ["India", "Singapore", "Japan", "USA", "UK", "UAE", "Australia"]
@@ -214,6 +220,26 @@ class CDCDataGenerator:
             logger.error(f"❌ INSERT failed: {e}")
             return None
     
+    def insert_many_meetings(self, count: int) -> List[str]:
+        """Insert ``count`` new meeting documents in one round-trip.
+        
+        Args:
+            count: Number of documents to insert
+            
+        Returns:
+            String ids of the inserted documents (empty on failure)
+        """
+        try:
+            docs = [self.generate_meeting_doc() for _ in range(count)]
+            result = self.collection.insert_many(docs, ordered=False)
+            self.stats['inserts'] += len(result.inserted_ids)
+            logger.info(f"✅ INSERT: {len(result.inserted_ids)} meetings")
+            return [str(doc_id) for doc_id in result.inserted_ids]
+        except Exception as e:
+            self.stats['errors'] += 1
+            logger.error(f"❌ INSERT failed: {e}")
+            return []
+    
     def update_meeting(self, doc_id: str = None) -> bool:
         """Update an existing meeting document."""
         try:
@@ -320,21 +346,33 @@ class CDCDataGenerator:
         interval = 1.0 / self.ops_per_sec
         end_time = time.time() + duration_seconds if duration_seconds > 0 else None
         
+        # Cumulative weights are built once; each op is one draw and a bisect
+        handlers = {
+            'insert': self.insert_meeting,
+            'update': self.update_meeting,
+            'delete': self.delete_meeting
+        }
+        operations = [handlers[op] for op in operation_weights]
+        cumulative = list(itertools.accumulate(operation_weights.values()))
+        total_weight = cumulative[-1]
+        last = len(operations) - 1
+        
+        # Sleep to a fixed schedule so operation latency does not stretch the rate
+        next_time = time.monotonic()
+        
         try:
             while True:
                 if end_time and time.time() >= end_time:
                     break
                 
                 # Select operation based on weights
-                rand = random.random()
-                if rand < operation_weights['insert']:
-                    self.insert_meeting()
-                elif rand < operation_weights['insert'] + operation_weights['update']:
-                    self.update_meeting()
-                else:
-                    self.delete_meeting()
+                index = bisect.bisect_right(cumulative, random.random() * total_weight)
+                operations[min(index, last)]()
                 
-                time.sleep(interval)
+                next_time += interval
+                delay = next_time - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
                 
         except KeyboardInterrupt:
             logger.info("\n⚠️  Interrupted by user")
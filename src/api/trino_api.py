@@ -210,7 +210,8 @@ def trino_health_check(current_user: UserResponse = Depends(get_current_active_u
     """Check Trino server connectivity."""
     client = get_trino_client()
     try:
-        catalogs = client.list_catalogs()
+        # Bypass the metadata cache so an unreachable server is reported
+        catalogs = client.list_catalogs(refresh=True)
         return {"status": "ok", "message": "Trino server is reachable", "catalogs_count": len(catalogs)}
     finally:
         client.close()
@@ -349,7 +349,8 @@ class ChangeStreamWatcher:
         # Open changestream
         stream_options = {
             "full_document": "updateLookup",
-            "batch_size": 100,
+            # Let the server return up to one flush worth of events per getMore
+            "batch_size": self.config.batch_size,
             "max_await_time_ms": 1000
         }
         
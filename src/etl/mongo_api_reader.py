@@ -17,17 +17,20 @@ from ..utils.logging import get_logger, CorrelationContext
 class MongoDataReader:
     """First ETL module that reads MongoDB data and returns appropriate DataFrame."""
     
-    def __init__(self, mongo_uri: str, database: str, collection: str):
+    def __init__(self, mongo_uri: str, database: str, collection: str, client=None):
         """Initialize the MongoDB data reader.
         
         Args:
             mongo_uri: MongoDB connection URI
             database: Database name
             collection: Collection name
+            client: Optional shared MongoClient; pandas reads reuse it instead
+                of connecting per read, and it is never closed by the reader
         """
         self.mongo_uri = mongo_uri
         self.database = database
         self.collection = collection
+        self.client = client
         self.logger = get_logger(__name__)
     
     def _compute_schema_fingerprint(self, df: pd.DataFrame) -> str:
@@ -78,12 +81,14 @@ class MongoDataReader:
         record_count = 0
         
         try:
+            read_kwargs = {'client': self.client} if self.client is not None else {}
             docs = mongo_conn.read_with_pymongo(
                 mongo_uri=self.mongo_uri,
                 database=self.database,
                 collection=self.collection,
                 query=query or {},
-                limit=limit
+                limit=limit,
+                **read_kwargs
             )
             
             if not docs:
@@ -275,18 +280,20 @@ class MongoDataReader:
             return self.read_to_pandas(query=query, limit=limit or 1000)
 
 
-def create_reader_from_connection_info(mongo_uri: str, database: str, collection: str) -> MongoDataReader:
+def create_reader_from_connection_info(mongo_uri: str, database: str, collection: str,
+                                       client=None) -> MongoDataReader:
     """Factory function to create a MongoDataReader from connection information.
     
     Args:
         mongo_uri: MongoDB connection URI
         database: Database name  
         collection: Collection name
+        client: Optional shared MongoClient to read through
         
     Returns:
         MongoDataReader instance
     """
-    return MongoDataReader(mongo_uri, database, collection)
+    return MongoDataReader(mongo_uri, database, collection, client=client)
 
 
 def create_reader_from_credentials(username: str, password: str, host: str, port: int, database: str, collection: str) -> MongoDataReader:
@@ -160,7 +160,8 @@ def create_pipeline_from_uri(
     mongo_uri: str,
     database: str,
     collection: str,
-    schema: Optional[Dict[str, Any]] = None
+    schema: Optional[Dict[str, Any]] = None,
+    client=None
 ) -> ETLPipeline:
     """Create an ETL pipeline from MongoDB URI.
     
@@ -169,13 +170,17 @@ def create_pipeline_from_uri(
         database: Database name
         collection: Collection name
         schema: Optional schema for transformation
+        client: Optional shared MongoClient; reads reuse it instead of
+            opening a client per run
         
     Returns:
         Configured ETLPipeline instance
     """
     from .mongo_api_reader import create_reader_from_connection_info
     
-    mongo_reader = create_reader_from_connection_info(mongo_uri, database, collection)
+    mongo_reader = create_reader_from_connection_info(
+        mongo_uri, database, collection, client=client
+    )
     transformer = DataTransformer(schema=schema)
     
     return ETLPipeline(mongo_reader, transformer)
@@ -42,6 +42,13 @@ class SchemaGenerator:
         'category': 'string',
     }
     
+    # Whether a (old_type, new_type) change breaks readers; unlisted pairs do
+    TYPE_CHANGE_BREAKING = {
+        ('integer', 'float'): False,  # Non-breaking
+        ('integer', 'string'): True,   # Breaking
+        ('float', 'string'): True,    # Breaking
+    }
+    
     @classmethod
     def generate_from_dataframe(cls, df: pd.DataFrame, sample_size: int = 1000, 
                               include_constraints: bool = True, 
@@ -81,6 +88,71 @@ class SchemaGenerator:
             
         return schema
     
+    @classmethod
+    def generate_from_documents(cls, documents: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Generate a schema directly from documents, without a DataFrame.
+        
+        Fields carry the same 'type' and 'nullable' keys as
+        generate_from_dataframe, which is all detect_breaking_changes reads;
+        value statistics are not computed. A field holding both integers and
+        floats is 'float'; any other mix of types falls back to 'string'.
+        
+        Args:
+            documents: Documents to analyze
+            
+        Returns:
+            Schema dictionary keyed by top-level field name
+        """
+        field_types: Dict[str, set] = {}
+        present_count: Dict[str, int] = {}
+        null_fields = set()
+        
+        for doc in documents:
+            for field, value in doc.items():
+                types = field_types.setdefault(field, set())
+                present_count[field] = present_count.get(field, 0) + 1
+                value_type = cls._value_type(value)
+                if value_type is None:
+                    null_fields.add(field)
+                else:
+                    types.add(value_type)
+        
+        schema = {}
+        for field, types in field_types.items():
+            if len(types) == 1:
+                field_type = next(iter(types))
+            elif types == {'integer', 'float'}:
+                field_type = 'float'
+            else:
+                field_type = 'string'
+            schema[field] = {
+                'type': field_type,
+                'nullable': field in null_fields or present_count[field] < len(documents)
+            }
+        return schema
+    
+    @classmethod
+    def _value_type(cls, value: Any) -> Optional[str]:
+        """Schema type of a single Python value, or None for nulls."""
+        if value is None or (isinstance(value, float) and value != value):
+            return None
+        # bool is checked before int, which it subclasses
+        if isinstance(value, (bool, np.bool_)):
+            return 'boolean'
+        if isinstance(value, (int, np.integer)):
+            return 'integer'
+        if isinstance(value, (float, np.floating)):
+            return 'float'
+        if isinstance(value, datetime):
+            return 'datetime'
+        if isinstance(value, dict):
+            return 'object'
+        if isinstance(value, list):
+            return 'array'
+        if isinstance(value, bytes):
+            return 'binary'
+        return 'string'
+    
     @classmethod
     def _compute_schema_hash(cls, schema: Dict[str, Any]) -> str:
         """Compute hash of schema for versioning.
@@ -165,53 +237,47 @@ class SchemaGenerator:
         else:
             col_schema['type'] = cls.DTYPE_MAPPING.get(dtype_str, 'string')
         
-        # Check for null values
-        null_count = series.isnull().sum()
+        # Get non-null values once; the null count follows from it
+        non_null_values = series.dropna()
         total_count = len(series)
+        null_count = total_count - len(non_null_values)
         col_schema['nullable'] = null_count > 0
         col_schema['null_percentage'] = round((null_count / total_count) * 100, 2) if total_count > 0 else 0
         
-        # Check for object types that might be nested structures
-        if dtype_str == 'object':
-            # Sample a few values to determine if it's a dict/list
-            sample_values = series.dropna().head(5)
-            if len(sample_values) > 0:
-                first_val = sample_values.iloc[0]
-                if isinstance(first_val, dict):
-                    col_schema['type'] = 'object'
-                elif isinstance(first_val, list):
-                    col_schema['type'] = 'array'
-                elif isinstance(first_val, bytes):
-                    col_schema['type'] = 'binary'
-                # Otherwise keep as 'string'
-        
-        # Get non-null values for further analysis
-        non_null_values = series.dropna()
-        
         if len(non_null_values) == 0:
             return col_schema
         
+        # Object columns are typed by their first non-null value
+        first_value = non_null_values.iloc[0]
+        if dtype_str == 'object' and isinstance(first_value, bytes):
+            col_schema['type'] = 'binary'
+        
         # Handle complex data types (lists, dicts)
-        if len(non_null_values) > 0:
-            first_value = non_null_values.iloc[0]
-            if isinstance(first_value, list):
-                col_schema['type'] = 'array'
-                col_schema['is_array'] = True
-                if len(first_value) > 0:
-                    col_schema['array_item_type'] = type(first_value[0]).__name__
-                col_schema['avg_array_length'] = float(non_null_values.apply(lambda x: len(x) if isinstance(x, list) else 0).mean())
-                return col_schema
-            elif isinstance(first_value, dict):
-                col_schema['type'] = 'object'
-                col_schema['is_object'] = True
-                # Analyze common keys
-                all_keys = set()
-                for item in non_null_values:
-                    if isinstance(item, dict):
-                        all_keys.update(item.keys())
-                col_schema['common_keys'] = sorted(list(all_keys))
-                return col_schema
-            
+        if isinstance(first_value, list):
+            col_schema['type'] = 'array'
+            col_schema['is_array'] = True
+            if len(first_value) > 0:
+                col_schema['array_item_type'] = type(first_value[0]).__name__
+            col_schema['avg_array_length'] = float(non_null_values.apply(lambda x: len(x) if isinstance(x, list) else 0).mean())
+            return col_schema
+        elif isinstance(first_value, dict):
+            col_schema['type'] = 'object'
+            col_schema['is_object'] = True
+            # Analyze common keys
+            all_keys = set()
+            for item in non_null_values:
+                if isinstance(item, dict):
+                    all_keys.update(item.keys())
+            col_schema['common_keys'] = sorted(list(all_keys))
+            return col_schema
+        
+        # Distinct count is shared by the categorical check and the statistics;
+        # None marks unhashable values
+        try:
+            unique_count = int(non_null_values.nunique())
+        except (TypeError, ValueError):
+            unique_count = None
+        
         # Type-specific analysis
         if col_schema['type'] in ['integer', 'float']:
             if include_constraints:
@@ -232,9 +298,12 @@ class SchemaGenerator:
                         except Exception:
                             return str(val)
                     
-                    # Convert to string safely
-                    str_values = non_null_values.apply(safe_str_convert)
-                    str_lengths = str_values.str.len()
+                    # Pure-str columns (the common case) are measured directly;
+                    # only mixed columns go through per-value conversion
+                    if pd.api.types.infer_dtype(non_null_values, skipna=False) == 'string':
+                        str_lengths = non_null_values.str.len()
+                    else:
+                        str_lengths = non_null_values.apply(safe_str_convert).str.len()
                     col_schema['min_length'] = int(str_lengths.min())
                     col_schema['max_length'] = int(str_lengths.max())
                     col_schema['avg_length'] = round(float(str_lengths.mean()), 2)
@@ -247,8 +316,7 @@ class SchemaGenerator:
                 
             # Check for common patterns
             try:
-                unique_values = non_null_values.nunique()
-                if unique_values <= 10:  # Likely categorical
+                if unique_count is not None and unique_count <= 10:  # Likely categorical
                     col_schema['suggested_values'] = sorted(non_null_values.unique().tolist())
                     col_schema['is_categorical'] = True
                 else:
@@ -286,10 +354,10 @@ class SchemaGenerator:
                 col_schema['max_date'] = str(non_null_values.max())
                 
         # General statistics
-        try:
-            col_schema['unique_count'] = int(non_null_values.nunique())
-            col_schema['duplicate_count'] = int(len(non_null_values) - non_null_values.nunique())
-        except (TypeError, ValueError):
+        if unique_count is not None:
+            col_schema['unique_count'] = unique_count
+            col_schema['duplicate_count'] = len(non_null_values) - unique_count
+        else:
             # Handle unhashable types
             col_schema['unique_count'] = -1  # Unknown
             col_schema['duplicate_count'] = -1  # Unknown
@@ -748,8 +816,9 @@ class SchemaGenerator:
         breaking_changes = []
         non_breaking_changes = []
         
-        old_fields = set(old_schema.keys())
-        new_fields = set(new_schema.keys())
+        # Key views support set operations directly, without copying
+        old_fields = old_schema.keys()
+        new_fields = new_schema.keys()
         
         # Fields removed (breaking)
         removed_fields = old_fields - new_fields
@@ -781,13 +850,7 @@ class SchemaGenerator:
             
             if old_type != new_type:
                 # Check if it's a breaking change
-                type_widening = {
-                    ('integer', 'float'): False,  # Non-breaking
-                    ('integer', 'string'): True,   # Breaking
-                    ('float', 'string'): True,    # Breaking
-                }
-                
-                is_breaking = type_widening.get((old_type, new_type), True)
+                is_breaking = cls.TYPE_CHANGE_BREAKING.get((old_type, new_type), True)
                 
                 change = {
                     "field": field,
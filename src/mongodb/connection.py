@@ -93,14 +93,18 @@ def _serialize_doc(doc: Dict[str, Any]) -> Dict[str, Any]:
     return serialized
 
 
-def read_with_pymongo(mongo_uri: str, database: str, collection: str, query: Optional[Dict[str, Any]] = None, limit: int = 10) -> List[Dict[str, Any]]:
+def read_with_pymongo(mongo_uri: str, database: str, collection: str, query: Optional[Dict[str, Any]] = None, limit: int = 10,
+                      client: Optional[pymongo.MongoClient] = None) -> List[Dict[str, Any]]:
     """Read documents from MongoDB using pymongo and return a small preview list.
 
     This function serializes all BSON types (ObjectId, Binary, datetime, etc.) to
-    JSON-compatible formats.
+    JSON-compatible formats. When ``client`` is given it is used instead of
+    connecting to ``mongo_uri`` and is left open for the caller.
     """
     query = query or {}
-    client = _get_client(mongo_uri)
+    owns_client = client is None
+    if owns_client:
+        client = _get_client(mongo_uri)
     try:
         db = client[database]
         coll: Collection = db[collection]
@@ -115,4 +119,5 @@ def read_with_pymongo(mongo_uri: str, database: str, collection: str, query: Opt
         # Wrap and re-raise with more context
         raise RuntimeError(f"Error reading from MongoDB: {str(e)}") from e
     finally:
-        client.close()
+        if owns_client:
+            client.close()
@@ -2,15 +2,76 @@
 Data quality rules engine with built-in rule library.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Optional, Tuple
+import numpy as np
 import pandas as pd
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+from dataclasses import dataclass, field
 from enum import Enum
 import re
 import logging
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Per-column staging shared by every rule that targets the same column:
+# (raw values, null mask, non-null values).
+ColumnArrays = Tuple[np.ndarray, np.ndarray, pd.Series]
+
+# HyperLogLog settings for approximate uniqueness: 2**14 one-byte registers
+# (16KB) give a standard error of about 0.8%.
+HLL_PRECISION = 14
+HLL_CHUNK_SIZE = 1 << 20
+
+
+def _approx_distinct_count(values: pd.Series, precision: int = HLL_PRECISION) -> int:
+    """
+    Estimate the number of distinct values with a HyperLogLog sketch.
+    
+    Values are hashed chunk by chunk with pandas' vectorized hashing, so
+    memory stays bounded by the chunk size and the register array instead
+    of growing with the number of distinct values.
+    
+    Args:
+        values: Non-null values to count
+        precision: Number of index bits (register count is 2**precision)
+        
+    Returns:
+        Estimated distinct count
+    """
+    m = 1 << precision
+    registers = np.zeros(m, dtype=np.uint8)
+    index_shift = np.uint64(64 - precision)
+    rank_shift = np.uint64(precision)
+    # Guard bit bounds the rank when all remaining hash bits are zero
+    guard = np.uint64(1 << (precision - 1))
+    
+    for start in range(0, len(values), HLL_CHUNK_SIZE):
+        chunk = values.iloc[start:start + HLL_CHUNK_SIZE]
+        hashes = pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+        index = (hashes >> index_shift).astype(np.intp)
+        remainder = (hashes << rank_shift) | guard
+        # Rank = leading zeros + 1; frexp's exponent is the bit length
+        _, bit_length = np.frexp(remainder.astype(np.float64))
+        rank = (65 - bit_length).astype(np.uint8)
+        np.maximum.at(registers, index, rank)
+    
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / np.sum(np.ldexp(1.0, -registers.astype(np.int64)))
+    
+    # Small-range correction (linear counting)
+    zeros = int(np.count_nonzero(registers == 0))
+    if estimate <= 2.5 * m and zeros > 0:
+        estimate = m * np.log(m / zeros)
+    
+    return int(round(estimate))
+
 
 class RuleType(str, Enum):
     NULL_THRESHOLD = "null_threshold"
@@ -24,6 +85,8 @@ class RuleType(str, Enum):
 
 class QualityRule(BaseModel):
     """Single quality rule definition."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     rule_id: str
     rule_type: RuleType
     column: str
@@ -31,15 +94,16 @@ class QualityRule(BaseModel):
     severity: str = "warning"  # error, warning, info
 
 
-class QualityResult(BaseModel):
-    """Result of quality check."""
+@dataclass(slots=True)
+class QualityResult:
+    """Result of quality check (engine-produced, so not validated)."""
     rule_id: str
     passed: bool
     severity: str
     message: str
     failed_count: int
     total_count: int
-    failed_values: List[Any] = []
+    failed_values: List[Any] = field(default_factory=list)
 
 
 class QualityRulesEngine:
@@ -85,10 +149,17 @@ class QualityRulesEngine:
         Returns:
             List of quality results
         """
+        # Stage each referenced column once; several rules commonly target
+        # the same column (e.g. null + pattern checks on "email").
+        column_cache: Dict[str, ColumnArrays] = {}
+        for column in {rule.column for rule in rules}:
+            if column in df.columns:
+                column_cache[column] = self._column_arrays(df, column)
+        
         results = []
         for rule in rules:
             try:
-                result = self._execute_rule(df, rule)
+                result = self._execute_rule(df, rule, column_cache)
                 results.append(result)
             except Exception as e:
                 logger.error(f"Error executing rule {rule.rule_id}: {e}")
@@ -103,24 +174,59 @@ class QualityRulesEngine:
         
         return results
     
+    def _column_arrays(
+        self,
+        df: pd.DataFrame,
+        column: str,
+        column_cache: Optional[Dict[str, ColumnArrays]] = None
+    ) -> ColumnArrays:
+        """
+        Return (values, null_mask, non_null) for a column.
+        
+        Values are taken without copying where pandas allows it, and the
+        null mask and non-null view are computed once per column instead
+        of once per rule.
+        
+        Args:
+            df: DataFrame being checked
+            column: Column name
+            column_cache: Optional cache populated by apply_rules
+            
+        Returns:
+            Tuple of raw values, boolean null mask and non-null Series
+        """
+        if column_cache is not None and column in column_cache:
+            return column_cache[column]
+        
+        series = df[column]
+        values = series.to_numpy(copy=False)
+        null_mask = np.asarray(pd.isna(values), dtype=bool)
+        non_null = series[~null_mask] if null_mask.any() else series
+        arrays = (values, null_mask, non_null)
+        
+        if column_cache is not None:
+            column_cache[column] = arrays
+        return arrays
+    
     def _execute_rule(
         self,
         df: pd.DataFrame,
-        rule: QualityRule
+        rule: QualityRule,
+        column_cache: Optional[Dict[str, ColumnArrays]] = None
     ) -> QualityResult:
         """Execute single rule."""
         if rule.rule_type == RuleType.NULL_THRESHOLD:
-            return self._check_null_threshold(df, rule)
+            return self._check_null_threshold(df, rule, column_cache)
         elif rule.rule_type == RuleType.TYPE_CHECK:
             return self._check_type(df, rule)
         elif rule.rule_type == RuleType.RANGE_CHECK:
-            return self._check_range(df, rule)
+            return self._check_range(df, rule, column_cache)
         elif rule.rule_type == RuleType.PATTERN_MATCH:
-            return self._check_pattern(df, rule)
+            return self._check_pattern(df, rule, column_cache)
         elif rule.rule_type == RuleType.UNIQUENESS:
-            return self._check_uniqueness(df, rule)
+            return self._check_uniqueness(df, rule, column_cache)
         elif rule.rule_type == RuleType.FRESHNESS:
-            return self._check_freshness(df, rule)
+            return self._check_freshness(df, rule, column_cache)
         else:
             return QualityResult(
                 rule_id=rule.rule_id,
@@ -134,7 +240,8 @@ class QualityRulesEngine:
     def _check_null_threshold(
         self,
         df: pd.DataFrame,
-        rule: QualityRule
+        rule: QualityRule,
+        column_cache: Optional[Dict[str, ColumnArrays]] = None
     ) -> QualityResult:
         """Check if nulls exceed threshold."""
         if rule.column not in df.columns:
@@ -147,7 +254,8 @@ class QualityRulesEngine:
                 total_count=len(df)
             )
         
-        null_count = df[rule.column].isnull().sum()
+        _, null_mask, _ = self._column_arrays(df, rule.column, column_cache)
+        null_count = int(null_mask.sum())
         total_count = len(df)
         null_percent = (null_count / total_count * 100) if total_count > 0 else 0
         
@@ -208,7 +316,8 @@ class QualityRulesEngine:
     def _check_range(
         self,
         df: pd.DataFrame,
-        rule: QualityRule
+        rule: QualityRule,
+        column_cache: Optional[Dict[str, ColumnArrays]] = None
     ) -> QualityResult:
         """Ensure values within min/max bounds."""
         if rule.column not in df.columns:
@@ -224,7 +333,8 @@ class QualityRulesEngine:
         min_value = rule.parameters.get("min_value")
         max_value = rule.parameters.get("max_value")
         
-        col_data = df[rule.column].dropna()
+        values, null_mask, _ = self._column_arrays(df, rule.column, column_cache)
+        col_data = values[~null_mask]
         
         if len(col_data) == 0:
             return QualityResult(
@@ -236,17 +346,20 @@ class QualityRulesEngine:
                 total_count=len(df)
             )
         
-        failed_mask = pd.Series([False] * len(df))
+        failed_mask = np.zeros(len(col_data), dtype=bool)
         
         if min_value is not None:
-            failed_mask |= (df[rule.column] < min_value)
+            failed_mask |= (col_data < min_value)
         if max_value is not None:
-            failed_mask |= (df[rule.column] > max_value)
+            failed_mask |= (col_data > max_value)
         
-        failed_count = failed_mask.sum()
+        failed_count = int(np.count_nonzero(failed_mask))
         passed = failed_count == 0
         
-        failed_values = df[rule.column][failed_mask].head(10).tolist() if not passed else []
+        # Index only the first 10 failures rather than filtering every one
+        failed_values = (
+            col_data[np.flatnonzero(failed_mask)[:10]].tolist() if not passed else []
+        )
         
         return QualityResult(
             rule_id=rule.rule_id,
@@ -261,7 +374,8 @@ class QualityRulesEngine:
     def _check_pattern(
         self,
         df: pd.DataFrame,
-        rule: QualityRule
+        rule: QualityRule,
+        column_cache: Optional[Dict[str, ColumnArrays]] = None
     ) -> QualityResult:
         """Regex validation."""
         if rule.column not in df.columns:
@@ -275,6 +389,10 @@ class QualityRulesEngine:
             )
         
         pattern = rule.parameters.get("pattern")
+        built_in_name = rule.parameters.get("built_in_name")
+        built_in = self.BUILT_IN_RULES.get(built_in_name, {})
+        if not pattern:
+            pattern = built_in.get("pattern")
         if not pattern:
             return QualityResult(
                 rule_id=rule.rule_id,
@@ -285,7 +403,7 @@ class QualityRulesEngine:
                 total_count=len(df)
             )
         
-        col_data = df[rule.column].dropna()
+        _, _, col_data = self._column_arrays(df, rule.column, column_cache)
         
         if len(col_data) == 0:
             return QualityResult(
@@ -298,11 +416,14 @@ class QualityRulesEngine:
             )
         
         # Check pattern match
-        matches = col_data.astype(str).str.match(pattern, na=False)
-        failed_count = (~matches).sum()
+        matches = self._match_pattern(col_data, pattern).to_numpy(dtype=bool)
+        failed_count = int(len(matches) - np.count_nonzero(matches))
         passed = failed_count == 0
         
-        failed_values = col_data[~matches].head(10).tolist() if not passed else []
+        # Index only the first 10 failures rather than filtering every one
+        failed_values = (
+            col_data.iloc[np.flatnonzero(~matches)[:10]].tolist() if not passed else []
+        )
         
         return QualityResult(
             rule_id=rule.rule_id,
@@ -314,10 +435,44 @@ class QualityRulesEngine:
             failed_values=failed_values
         )
     
+    def _match_pattern(
+        self,
+        col_data: pd.Series,
+        pattern: str
+    ) -> pd.Series:
+        """
+        Match non-null values against a regex anchored at the start.
+        
+        Arrow-backed columns are matched in Arrow compute against the
+        string buffer; string columns skip the astype(str) copy and use the
+        precompiled matcher when the pattern is a built-in one. Anything
+        else (or a regex RE2 cannot compile) takes the generic path.
+        """
+        if PYARROW_AVAILABLE and isinstance(col_data.dtype, pd.ArrowDtype):
+            try:
+                # str.match semantics: anchor at start, not a full search
+                pa_matches = pc.match_substring_regex(
+                    col_data.array._pa_array, f"^(?:{pattern})"
+                )
+                return pd.Series(
+                    pa_matches.to_numpy(zero_copy_only=False),
+                    index=col_data.index
+                )
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                pass
+        elif pd.api.types.is_string_dtype(col_data):
+            matcher = _BUILT_IN_MATCHERS.get(pattern)
+            if matcher is not None:
+                return pd.Series(matcher(col_data.to_numpy()), index=col_data.index)
+            return col_data.str.match(pattern, na=False)
+        
+        return col_data.astype(str).str.match(pattern, na=False)
+    
     def _check_uniqueness(
         self,
         df: pd.DataFrame,
-        rule: QualityRule
+        rule: QualityRule,
+        column_cache: Optional[Dict[str, ColumnArrays]] = None
     ) -> QualityResult:
         """Check for duplicates."""
         if rule.column not in df.columns:
@@ -330,18 +485,35 @@ class QualityRulesEngine:
                 total_count=len(df)
             )
         
-        col_data = df[rule.column].dropna()
-        unique_count = col_data.nunique()
+        _, _, col_data = self._column_arrays(df, rule.column, column_cache)
         total_count = len(col_data)
-        duplicate_count = total_count - unique_count
+        approximate = rule.parameters.get("approximate", False)
+        
+        if approximate:
+            # Clamp: the sketch may overshoot the row count slightly
+            unique_count = min(_approx_distinct_count(col_data), total_count)
+        elif (
+            PYARROW_AVAILABLE
+            and isinstance(col_data.dtype, np.dtype)
+            and col_data.dtype.kind in "biufM"
+        ):
+            # Count over the packed Arrow buffer instead of a Python hash set
+            unique_count = pc.count_distinct(pa.array(col_data.to_numpy())).as_py()
+        else:
+            unique_count = col_data.nunique()
+        duplicate_count = int(total_count - unique_count)
         
         passed = duplicate_count == 0
         
+        message = f"Duplicates: {duplicate_count} (unique: {unique_count}, total: {total_count})"
+        if approximate:
+            message += " (approximate)"
+        
         return QualityResult(
             rule_id=rule.rule_id,
             passed=passed,
             severity=rule.severity,
-            message=f"Duplicates: {duplicate_count} (unique: {unique_count}, total: {total_count})",
+            message=message,
             failed_count=duplicate_count,
             total_count=total_count
         )
@@ -349,7 +521,8 @@ class QualityRulesEngine:
     def _check_freshness(
         self,
         df: pd.DataFrame,
-        rule: QualityRule
+        rule: QualityRule,
+        column_cache: Optional[Dict[str, ColumnArrays]] = None
     ) -> QualityResult:
         """Ensure data is recent (compare timestamp)."""
         if rule.column not in df.columns:
@@ -366,7 +539,8 @@ class QualityRulesEngine:
         
         try:
             # Convert to datetime if needed
-            col_data = pd.to_datetime(df[rule.column], errors='coerce').dropna()
+            _, _, non_null = self._column_arrays(df, rule.column, column_cache)
+            col_data = pd.to_datetime(non_null, errors='coerce').dropna()
             
             if len(col_data) == 0:
                 return QualityResult(
@@ -381,7 +555,7 @@ class QualityRulesEngine:
             from datetime import datetime, timedelta
             cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
             
-            stale_count = (col_data < cutoff_time).sum()
+            stale_count = int((col_data < cutoff_time).sum())
             passed = stale_count == 0
             
             return QualityResult(
@@ -526,3 +700,26 @@ class QualityRulesEngine:
         
         return recommendations[:5]  # Top 5 recommendations
 
+
+def _compile_matcher(pattern: str) -> Callable[[np.ndarray], np.ndarray]:
+    """Bind a precompiled regex into a matcher over an array of strings."""
+    match = re.compile(pattern).match
+    
+    def matcher(values: np.ndarray) -> np.ndarray:
+        return np.fromiter(
+            (match(value) is not None for value in values),
+            dtype=bool,
+            count=len(values)
+        )
+    
+    return matcher
+
+
+# Built-in patterns are known at import time, so compile them once. Keyed by
+# the pattern itself so rules spelling it out (e.g. RULE_TEMPLATES) dispatch to
+# the bound matcher as well as rules referencing it by built_in_name.
+_BUILT_IN_MATCHERS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    spec["pattern"]: _compile_matcher(spec["pattern"])
+    for spec in QualityRulesEngine.BUILT_IN_RULES.values()
+    if spec["type"] == RuleType.PATTERN_MATCH.value
+}
@@ -4,17 +4,242 @@ Transform Plan Manager
 Manages versioned transform plans with rollback capability.
 """
 
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
+import copy
+import errno
 import json
 import os
 import hashlib
+import tempfile
+import threading
+import time
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
 
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Maximum number of parsed plans kept in memory per PlanManager
+PLAN_CACHE_SIZE = 256
+
+# Plan bodies are stored zstd-compressed when zstandard is installed; plain
+# .json bodies from older releases (or without zstandard) are still read
+PLAN_SUFFIX = ".json"
+COMPRESSED_PLAN_SUFFIX = ".json.zst"
+ZSTD_LEVEL = 3
+
+# Per-collection append-only log of applied plans
+APPLIED_LOG_NAME = "applied.jsonl"
+
+# list_plans reads files concurrently above this many plans; smaller
+# directories are cheaper to read serially than to start a thread pool
+PARALLEL_LIST_THRESHOLD = 8
+MAX_LIST_WORKERS = 32
+
+if ORJSON_AVAILABLE:
+    # Datetimes pass through to default=str to match the stdlib encoding
+    _ORJSON_OPTIONS = (
+        orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+
+# (epoch second, "%Y-%m-%dT%H:%M:%S" string) of the last formatted timestamp
+_iso_second_cache: Tuple[int, str] = (-1, "")
+
+
+def _now_iso() -> str:
+    """Current UTC time as ISO-8601 with microseconds and a Z suffix.
+    
+    The date/time prefix is formatted once per second and reused, so
+    back-to-back status updates only format the microseconds.
+    """
+    global _iso_second_cache
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _iso_second_cache
+    if seconds != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _iso_second_cache = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}Z"
+
+
+def _dump_plan_bytes(plan: Dict[str, Any]) -> bytes:
+    """Serialize a plan to UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(plan, default=str, option=_ORJSON_OPTIONS)
+    return json.dumps(plan, indent=2, default=str).encode('utf-8')
+
+
+def _dump_log_line(entry: Dict[str, Any]) -> bytes:
+    """Serialize a log entry as one compact JSON line."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(entry, default=str, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(entry, default=str) + "\n").encode('utf-8')
+
+
+def _load_plan_bytes(data: bytes) -> Dict[str, Any]:
+    """Parse plan JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _compress(data: bytes) -> bytes:
+    """Compress bytes for a .zst file (a compressor per call: not thread-safe)."""
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+
+
+def _decompress(data: bytes) -> bytes:
+    """Decompress the contents of a .zst file."""
+    if not ZSTD_AVAILABLE:
+        raise RuntimeError("zstandard is required to read compressed plans")
+    return zstandard.ZstdDecompressor().decompress(data)
+
+
+def _freeze_plan(plan: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn top-level lists (operations, rollback_plan) into tuples.
+    
+    Cached plans are shared between callers, so their sequences are made
+    immutable once at load time instead of deep-copying on every read.
+    """
+    return {
+        key: tuple(value) if isinstance(value, list) else value
+        for key, value in plan.items()
+    }
+
+
+def _thaw_plan(plan: Mapping[str, Any]) -> Dict[str, Any]:
+    """Deep-copy a cached plan back into plain, JSON-serializable dicts and lists."""
+    return {
+        key: [copy.deepcopy(item) for item in value] if isinstance(value, tuple)
+        else copy.deepcopy(value)
+        for key, value in plan.items()
+    }
+
+
+# os.link errors meaning the filesystem has no hard links (FUSE, SMB, ...)
+_NO_HARD_LINK_ERRNOS = frozenset(
+    code for code in (
+        getattr(errno, name, None) for name in ("EPERM", "ENOTSUP", "EOPNOTSUPP", "ENOSYS")
+    ) if code is not None
+)
+
+
+def _claim_and_replace(tmp_path: str, path: Path) -> None:
+    """Claim path with O_CREAT|O_EXCL, then rename the temp file over the claim.
+    
+    Fallback for exclusive writes where os.link is unsupported.
+    
+    Raises:
+        FileExistsError: If path already exists
+    """
+    os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+    try:
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Release the claim rather than leave an empty plan file behind
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+        raise
+
+
+def _atomic_write_bytes(path: Path, data: bytes, exclusive: bool = False) -> None:
+    """Write a file atomically: temp file in the same directory, then rename.
+    
+    A crash mid-write leaves the previous file intact instead of a torn one.
+    
+    Args:
+        path: Destination file
+        data: File contents
+        exclusive: Hard-link the temp file into place instead of renaming,
+            so an existing file is never replaced. Filesystems without hard
+            links claim the name with O_EXCL first and then rename
+    
+    Raises:
+        FileExistsError: If exclusive and path already exists
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if exclusive:
+            try:
+                os.link(tmp_path, path)
+            except OSError as e:
+                if e.errno not in _NO_HARD_LINK_ERRNOS:
+                    raise
+                _claim_and_replace(tmp_path, path)
+            else:
+                os.unlink(tmp_path)
+        else:
+            os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _rollback_type_conversion(op: Dict[str, Any]) -> Dict[str, Any]:
+    # Rollback: convert back to original type
+    return {
+        "type": "type_conversion",
+        "field": op.get("field"),
+        "target_type": op.get("original_type"),
+        "original_type": op.get("target_type")
+    }
+
+
+def _rollback_add_field(op: Dict[str, Any]) -> Dict[str, Any]:
+    # Rollback: remove field
+    return {"type": "remove_field", "field": op.get("field")}
+
+
+def _rollback_remove_field(op: Dict[str, Any]) -> Dict[str, Any]:
+    # Rollback: add field back with original value (if stored)
+    return {
+        "type": "add_field",
+        "field": op.get("field"),
+        "default_value": op.get("original_value")
+    }
+
+
+def _rollback_fill_null(op: Dict[str, Any]) -> Dict[str, Any]:
+    # Rollback: set back to null (cannot fully rollback, but mark for review)
+    return {
+        "type": "set_null",
+        "field": op.get("field"),
+        "note": "Partial rollback - original null values cannot be restored"
+    }
+
+
+# Inverse-operation builders by operation type; other types have no rollback
+_ROLLBACK_BUILDERS = {
+    "type_conversion": _rollback_type_conversion,
+    "add_field": _rollback_add_field,
+    "remove_field": _rollback_remove_field,
+    "fill_null": _rollback_fill_null,
+}
+
 
 class PlanManager:
     """Manages versioned transform plans."""
@@ -32,6 +257,16 @@ class PlanManager:
         self.plans_dir = metadata_base / "plans"
         self.plans_dir.mkdir(parents=True, exist_ok=True)
         self.logger = get_logger(__name__)
+        
+        # Parsed plans keyed by file path, tagged with the (mtime_ns, size)
+        # they were read at so external rewrites invalidate the entry
+        self._plan_cache: "OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Any]]]" = OrderedDict()
+        self._plan_cache_max = PLAN_CACHE_SIZE
+        # Guards the LRU bookkeeping while list_plans reads from a thread pool
+        self._plan_cache_lock = threading.Lock()
+        
+        # Highest plan version per collection, populated lazily from filenames
+        self._max_version: Dict[str, int] = {}
     
     def create_plan(self, collection: str, input_schema_hash: str, 
                    output_schema_hash: str, operations_list: List[Dict[str, Any]],
@@ -49,34 +284,53 @@ class PlanManager:
             Plan dictionary
         """
         try:
-            # Get next version if not provided
-            if version is None:
-                version = self._get_next_version(collection)
-            
-            # Create plan
-            plan = {
-                "plan_id": self._generate_plan_id(collection, version),
-                "collection": collection,
-                "version": version,
-                "input_schema_hash": input_schema_hash,
-                "output_schema_hash": output_schema_hash,
-                "operations": operations_list,
-                "created_at": datetime.utcnow().isoformat() + "Z",
-                "approved": False,
-                "applied": False
-            }
-            
-            # Generate rollback plan
-            rollback_plan = self._generate_rollback_plan(plan)
-            plan["rollback_plan"] = rollback_plan
-            
-            # Save plan
             plan_dir = self.plans_dir / collection
             plan_dir.mkdir(parents=True, exist_ok=True)
-            plan_file = plan_dir / f"{version}.json"
+            suffix = COMPRESSED_PLAN_SUFFIX if ZSTD_AVAILABLE else PLAN_SUFFIX
+            auto_version = version is None
             
-            with open(plan_file, 'w') as f:
-                json.dump(plan, f, indent=2, default=str)
+            while True:
+                # Get next version if not provided
+                if auto_version:
+                    version = self._get_next_version(collection)
+                
+                # Create plan
+                plan = {
+                    "plan_id": self._generate_plan_id(collection, version),
+                    "collection": collection,
+                    "version": version,
+                    "input_schema_hash": input_schema_hash,
+                    "output_schema_hash": output_schema_hash,
+                    "operations": operations_list,
+                    "created_at": _now_iso(),
+                    "approved": False,
+                    "applied": False
+                }
+                
+                # Generate rollback plan
+                rollback_plan = self._generate_rollback_plan(plan)
+                plan["rollback_plan"] = rollback_plan
+                
+                # Save plan
+                plan_file = plan_dir / f"{version}{suffix}"
+                if not auto_version:
+                    self._write_plan(plan_file, plan)
+                    break
+                
+                # Another PlanManager on the same directory may have taken
+                # this version since our counter was loaded: claim the file
+                # exclusively and rescan the filenames if it is taken
+                try:
+                    if self._find_plan_file(collection, version) is not None:
+                        raise FileExistsError(str(plan_file))
+                    self._write_plan(plan_file, plan, exclusive=True)
+                    break
+                except FileExistsError:
+                    self._max_version.pop(collection, None)
+            
+            self._max_version[collection] = max(
+                self._max_version.get(collection, 0), version
+            )
             
             self.logger.info(
                 f"Created transform plan: {plan['plan_id']}",
@@ -112,49 +366,12 @@ class PlanManager:
         Returns:
             List of inverse operations for rollback
         """
-        rollback_ops = []
-        operations = plan.get("operations", [])
-        
-        # Reverse operations in reverse order
-        for op in reversed(operations):
-            op_type = op.get("type")
-            field = op.get("field")
-            
-            if op_type == "type_conversion":
-                # Rollback: convert back to original type
-                original_type = op.get("original_type")
-                rollback_ops.append({
-                    "type": "type_conversion",
-                    "field": field,
-                    "target_type": original_type,
-                    "original_type": op.get("target_type")
-                })
-            
-            elif op_type == "add_field":
-                # Rollback: remove field
-                rollback_ops.append({
-                    "type": "remove_field",
-                    "field": field
-                })
-            
-            elif op_type == "remove_field":
-                # Rollback: add field back with original value (if stored)
-                original_value = op.get("original_value")
-                rollback_ops.append({
-                    "type": "add_field",
-                    "field": field,
-                    "default_value": original_value
-                })
-            
-            elif op_type == "fill_null":
-                # Rollback: set back to null (cannot fully rollback, but mark for review)
-                rollback_ops.append({
-                    "type": "set_null",
-                    "field": field,
-                    "note": "Partial rollback - original null values cannot be restored"
-                })
-        
-        return rollback_ops
+        # Inverse operations, applied in reverse order
+        return [
+            _ROLLBACK_BUILDERS[op["type"]](op)
+            for op in reversed(plan.get("operations", []))
+            if op.get("type") in _ROLLBACK_BUILDERS
+        ]
     
     def get_plan(self, collection: str, version: int) -> Optional[Dict[str, Any]]:
         """Get transform plan by version.
@@ -164,16 +381,29 @@ class PlanManager:
             version: Plan version
             
         Returns:
-            Plan dictionary or None if not found
+            Plan dictionary (a copy the caller may modify) or None if not found
         """
-        try:
-            plan_file = self.plans_dir / collection / f"{version}.json"
+        plan = self.get_plan_view(collection, version)
+        return _thaw_plan(plan) if plan is not None else None
+    
+    def get_plan_view(self, collection: str, version: int) -> Optional[Mapping[str, Any]]:
+        """Get a read-only view of a transform plan without copying it.
+        
+        The view shares data with the plan cache, and its operations and
+        rollback_plan are tuples; use get_plan for a plain dict.
+        
+        Args:
+            collection: Collection name
+            version: Plan version
             
-            if not plan_file.exists():
+        Returns:
+            Read-only plan mapping or None if not found
+        """
+        try:
+            if self._find_plan_file(collection, version) is None:
                 return None
             
-            with open(plan_file, 'r') as f:
-                return json.load(f)
+            return MappingProxyType(self._read_plan(collection, version))
                 
         except Exception as e:
             self.logger.error(
@@ -197,19 +427,22 @@ class PlanManager:
         Returns:
             List of plan dictionaries
         """
-        plans = []
-        plan_dir = self.plans_dir / collection
-        
-        if not plan_dir.exists():
-            return plans
-        
         try:
-            for plan_file in sorted(plan_dir.glob("*.json")):
-                with open(plan_file, 'r') as f:
-                    plan = json.load(f)
-                    plans.append(plan)
-            
-            return sorted(plans, key=lambda p: p.get("version", 0), reverse=True)
+            # Already newest first from the filenames; no second sort needed
+            versions = self.list_plan_versions(collection)
+            if len(versions) <= PARALLEL_LIST_THRESHOLD:
+                return [
+                    _thaw_plan(self._read_plan(collection, version)) for version in versions
+                ]
+            
+            # Parse the shared applied log once before fanning out
+            self._load_applied_log(collection)
+            workers = min(MAX_LIST_WORKERS, len(versions))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # map preserves input order, so the result stays newest first
+                return list(executor.map(
+                    lambda version: _thaw_plan(self._read_plan(collection, version)), versions
+                ))
             
         except Exception as e:
             self.logger.error(
@@ -223,6 +456,38 @@ class PlanManager:
             )
             return []
     
+    def list_plan_versions(self, collection: str) -> List[int]:
+        """List plan versions for a collection without loading any plan.
+        
+        Args:
+            collection: Collection name
+            
+        Returns:
+            Plan versions, newest first
+        """
+        plan_dir = self.plans_dir / collection
+        versions = []
+        
+        try:
+            with os.scandir(plan_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.endswith(COMPRESSED_PLAN_SUFFIX):
+                        stem = name[:-len(COMPRESSED_PLAN_SUFFIX)]
+                    elif name.endswith(PLAN_SUFFIX):
+                        stem = name[:-len(PLAN_SUFFIX)]
+                    else:
+                        continue
+                    try:
+                        versions.append(int(stem))
+                    except ValueError:
+                        continue
+        except FileNotFoundError:
+            return []
+        
+        # A set: a version may briefly exist in both formats
+        return sorted(set(versions), reverse=True)
+    
     def approve_plan(self, collection: str, version: int, approved_by: str) -> bool:
         """Approve a transform plan.
         
@@ -235,18 +500,16 @@ class PlanManager:
             True if successful, False otherwise
         """
         try:
-            plan = self.get_plan(collection, version)
+            plan = self.get_plan_view(collection, version)
             if not plan:
                 return False
             
-            plan["approved"] = True
-            plan["approved_by"] = approved_by
-            plan["approved_at"] = datetime.utcnow().isoformat() + "Z"
-            
-            # Save updated plan
-            plan_file = self.plans_dir / collection / f"{version}.json"
-            with open(plan_file, 'w') as f:
-                json.dump(plan, f, indent=2, default=str)
+            # Only the small status side-car is rewritten
+            self._update_status(collection, version, {
+                "approved": True,
+                "approved_by": approved_by,
+                "approved_at": _now_iso()
+            })
             
             self.logger.info(
                 f"Transform plan approved: {plan['plan_id']} by {approved_by}",
@@ -285,17 +548,18 @@ class PlanManager:
             True if successful, False otherwise
         """
         try:
-            plan = self.get_plan(collection, version)
+            plan = self.get_plan_view(collection, version)
             if not plan:
                 return False
             
-            plan["applied"] = True
-            plan["applied_at"] = datetime.utcnow().isoformat() + "Z"
-            
-            # Save updated plan
-            plan_file = self.plans_dir / collection / f"{version}.json"
-            with open(plan_file, 'w') as f:
-                json.dump(plan, f, indent=2, default=str)
+            # Append-only audit log: O(1) write regardless of plan size
+            entry = {
+                "plan_id": plan["plan_id"],
+                "version": version,
+                "applied_at": _now_iso()
+            }
+            with open(self.plans_dir / collection / APPLIED_LOG_NAME, 'ab') as f:
+                f.write(_dump_log_line(entry))
             
             return True
             
@@ -312,6 +576,177 @@ class PlanManager:
             )
             return False
     
+    def _read_plan(self, collection: str, version: int) -> Dict[str, Any]:
+        """Read a plan with its status side-car merged in.
+        
+        The plan body ({version}.json.zst) is written once at creation; approval
+        lives in {version}.status.json and applied markers in the
+        collection's append-only applied.jsonl, so status transitions never
+        re-serialize the plan's operations.
+        
+        Args:
+            collection: Collection name
+            version: Plan version
+            
+        Returns:
+            Plan dictionary
+        """
+        plan_dir = self.plans_dir / collection
+        plan_file = self._find_plan_file(collection, version)
+        if plan_file is None:
+            raise FileNotFoundError(f"No plan version {version} for {collection}")
+        # Shallow copy: top-level status fields are per-call, nested values
+        # (operations, rollback_plan) are shared with the cache
+        plan = dict(self._load_plan_file(plan_file))
+        try:
+            plan.update(self._load_plan_file(plan_dir / f"{version}.status.json"))
+        except FileNotFoundError:
+            pass
+        
+        applied_at = self._load_applied_log(collection).get(version)
+        if applied_at is not None:
+            plan["applied"] = True
+            plan["applied_at"] = applied_at
+        return plan
+    
+    def _find_plan_file(self, collection: str, version: int) -> Optional[Path]:
+        """Locate a plan body, preferring the compressed file.
+        
+        Args:
+            collection: Collection name
+            version: Plan version
+            
+        Returns:
+            Path to the plan file, or None if the version does not exist
+        """
+        plan_dir = self.plans_dir / collection
+        for suffix in (COMPRESSED_PLAN_SUFFIX, PLAN_SUFFIX):
+            plan_file = plan_dir / f"{version}{suffix}"
+            if plan_file.exists():
+                return plan_file
+        return None
+    
+    def _load_applied_log(self, collection: str) -> Dict[int, str]:
+        """Load the applied-plan log as {version: applied_at}.
+        
+        Parsed once and cached until the log file grows or changes.
+        
+        Args:
+            collection: Collection name
+            
+        Returns:
+            Latest applied_at per applied plan version
+        """
+        log_file = self.plans_dir / collection / APPLIED_LOG_NAME
+        key = str(log_file)
+        try:
+            stat = os.stat(log_file)
+        except FileNotFoundError:
+            return {}
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+        
+        with self._plan_cache_lock:
+            cached = self._plan_cache.get(key)
+            if cached is not None and cached[0] == fingerprint:
+                self._plan_cache.move_to_end(key)
+                return cached[1]
+        
+        applied: Dict[int, str] = {}
+        with open(log_file, 'rb') as f:
+            for line in f:
+                try:
+                    entry = _load_plan_bytes(line)
+                    applied[int(entry["version"])] = entry["applied_at"]
+                except (ValueError, KeyError, TypeError):
+                    # Skip a torn trailing line from an interrupted append
+                    continue
+        self._store_cached_plan(key, fingerprint, applied)
+        return applied
+    
+    def _update_status(self, collection: str, version: int,
+                       changes: Dict[str, Any]) -> None:
+        """Merge changes into a plan's status side-car file.
+        
+        Args:
+            collection: Collection name
+            version: Plan version
+            changes: Status fields to set
+        """
+        status_file = self.plans_dir / collection / f"{version}.status.json"
+        try:
+            status = dict(self._load_plan_file(status_file))
+        except FileNotFoundError:
+            status = {}
+        status.update(changes)
+        self._write_plan(status_file, status)
+    
+    def _load_plan_file(self, plan_file: Path) -> Dict[str, Any]:
+        """Load a plan file, serving repeat reads from the LRU cache.
+        
+        The cached object itself is returned; callers must copy before
+        modifying it.
+        
+        Args:
+            plan_file: Path to the plan JSON file
+            
+        Returns:
+            Parsed plan dictionary (shared, read-only by convention)
+        """
+        key = str(plan_file)
+        stat = os.stat(plan_file)
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+        
+        with self._plan_cache_lock:
+            cached = self._plan_cache.get(key)
+            if cached is not None and cached[0] == fingerprint:
+                self._plan_cache.move_to_end(key)
+                return cached[1]
+        
+        with open(plan_file, 'rb') as f:
+            data = f.read()
+        if plan_file.suffix == ".zst":
+            data = _decompress(data)
+        plan = _freeze_plan(_load_plan_bytes(data))
+        self._store_cached_plan(key, fingerprint, plan)
+        return plan
+    
+    def _write_plan(self, plan_file: Path, plan: Dict[str, Any],
+                    exclusive: bool = False) -> None:
+        """Write a plan (or plan status) file and cache the parsed result.
+        
+        The write is atomic, so readers never see a partially written plan.
+        Files with a .zst suffix are zstd-compressed.
+        
+        Args:
+            plan_file: Path to write the plan to
+            plan: Plan dictionary
+            exclusive: Fail instead of replacing an existing file
+        
+        Raises:
+            FileExistsError: If exclusive and plan_file already exists
+        """
+        serialized = _dump_plan_bytes(plan)
+        if plan_file.suffix == ".zst":
+            _atomic_write_bytes(plan_file, _compress(serialized), exclusive)
+        else:
+            _atomic_write_bytes(plan_file, serialized, exclusive)
+        
+        # Cache what a read from disk would return (default=str applied)
+        stat = os.stat(plan_file)
+        self._store_cached_plan(
+            str(plan_file), (stat.st_mtime_ns, stat.st_size),
+            _freeze_plan(_load_plan_bytes(serialized))
+        )
+    
+    def _store_cached_plan(self, key: str, fingerprint: Tuple[int, int],
+                           plan: Dict[str, Any]) -> None:
+        """Insert a parsed plan into the LRU cache, evicting the oldest entry."""
+        with self._plan_cache_lock:
+            self._plan_cache[key] = (fingerprint, plan)
+            self._plan_cache.move_to_end(key)
+            if len(self._plan_cache) > self._plan_cache_max:
+                self._plan_cache.popitem(last=False)
+    
     def _get_next_version(self, collection: str) -> int:
         """Get next version number for a collection.
         
@@ -321,12 +756,12 @@ class PlanManager:
         Returns:
             Next version number
         """
-        plans = self.list_plans(collection)
-        if not plans:
-            return 1
+        if collection not in self._max_version:
+            # Cold start: versions are encoded in filenames, no JSON parse needed
+            versions = self.list_plan_versions(collection)
+            self._max_version[collection] = versions[0] if versions else 0
         
-        max_version = max(p.get("version", 0) for p in plans)
-        return max_version + 1
+        return self._max_version[collection] + 1
     
     def _generate_plan_id(self, collection: str, version: int) -> str:
         """Generate deterministic plan ID.
@@ -338,6 +773,8 @@ class PlanManager:
         Returns:
             Plan ID
         """
-        combined = f"{collection}_v{version}_{datetime.utcnow().strftime('%Y%m%d')}"
-        return hashlib.sha256(combined.encode('utf-8')).hexdigest()[:16]
+        date = _now_iso()[:10].replace("-", "")
+        combined = f"{collection}_v{version}_{date}"
+        # 8-byte BLAKE2b digest: same 16 hex chars as the old truncated SHA-256
+        return hashlib.blake2b(combined.encode('utf-8'), digest_size=8).hexdigest()
 
@@ -1,20 +1,42 @@
 """
 Trino client for executing queries and managing connections.
 """
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Iterator, Tuple
+import functools
+import queue
+import threading
 import time
 from datetime import datetime
 
-try:
-    import trino
-    from trino.exceptions import TrinoQueryError, TrinoUserError, TrinoExternalError
-    TRINO_AVAILABLE = True
-except ImportError:
-    TRINO_AVAILABLE = False
-    trino = None
-    TrinoQueryError = Exception
-    TrinoUserError = Exception
-    TrinoExternalError = Exception
+import importlib.util
+
+# The trino package (and requests/urllib3 behind it) is imported on first
+# connection, not at module import; availability is checked without importing.
+TRINO_AVAILABLE = importlib.util.find_spec("trino") is not None
+trino = None
+TrinoQueryError = Exception
+TrinoUserError = Exception
+TrinoExternalError = Exception
+_trino_imported: Optional[bool] = None  # None until the import is attempted
+
+
+def _import_trino() -> bool:
+    """Import the trino library on first use and bind it to module globals.
+    
+    Returns:
+        True if the library is importable
+    """
+    global trino, TrinoQueryError, TrinoUserError, TrinoExternalError, _trino_imported
+    if _trino_imported is None:
+        try:
+            import trino.dbapi
+            from trino.exceptions import (
+                TrinoQueryError, TrinoUserError, TrinoExternalError
+            )
+            _trino_imported = True
+        except ImportError:
+            _trino_imported = False
+    return _trino_imported
 
 from .models import TrinoConfig, TrinoQueryRequest, TrinoTableInfo, TrinoSchemaInfo, TrinoCatalogInfo, TrinoColumnInfo
 
@@ -24,9 +46,163 @@ class TrinoError(Exception):
     pass
 
 
+# Idle connections kept per distinct TrinoConfig, most recently used first
+MAX_POOL_SIZE = 8
+# Pooled connections idle longer than this are ping-tested before reuse
+POOL_PING_IDLE_SECONDS = 60
+
+_POOL: Dict[Tuple, "queue.LifoQueue"] = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _quote_ident(name: str) -> str:
+    """Quote a SQL identifier so names cannot inject SQL.
+    
+    Also keeps statement text stable for the same object, which lets the
+    coordinator reuse cached plans.
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _pool_key(config: TrinoConfig) -> Tuple:
+    """Build the pool key for connections opened with this config."""
+    return (
+        config.host,
+        config.port,
+        config.user,
+        config.catalog,
+        config.schema,
+        config.http_scheme,
+        config.request_timeout,
+        tuple(sorted(config.session_properties.items()))
+    )
+
+
+def _get_pool(key: Tuple) -> "queue.LifoQueue":
+    """Get (or create) the idle-connection pool for a key."""
+    with _POOL_LOCK:
+        pool = _POOL.get(key)
+        if pool is None:
+            pool = queue.LifoQueue(maxsize=MAX_POOL_SIZE)
+            _POOL[key] = pool
+        return pool
+
+
+def _is_alive(connection) -> bool:
+    """Ping a pooled connection with a trivial query."""
+    try:
+        cursor = connection.cursor()
+        cursor.execute("SELECT 1")
+        cursor.fetchall()
+        return True
+    except Exception:
+        return False
+
+
+# Catalog/schema/table metadata changes rarely; cache listings across
+# clients for a short TTL (seconds)
+METADATA_CACHE_TTL_SECONDS = 120
+DESCRIBE_CACHE_TTL_SECONDS = 300
+# Upper bound on cached entries; keys include user-supplied table names
+METADATA_CACHE_MAX_ENTRIES = 1024
+
+_METADATA_CACHE: Dict[Tuple, Tuple[float, list]] = {}
+_METADATA_CACHE_LOCK = threading.Lock()
+
+# Statements after which cached metadata may be stale
+_DDL_PREFIXES = ("CREATE", "DROP", "ALTER", "COMMENT")
+
+
+def _store_metadata(key: Tuple, expires_at: float, value: list, now: float) -> None:
+    """Insert a cache entry, keeping the cache within METADATA_CACHE_MAX_ENTRIES.
+    
+    When full, expired entries are swept first; if that frees nothing the
+    oldest inserted entries are evicted. Caller must hold _METADATA_CACHE_LOCK.
+    """
+    # Re-inserting moves the key to the end, keeping insertion order oldest first
+    _METADATA_CACHE.pop(key, None)
+    if len(_METADATA_CACHE) >= METADATA_CACHE_MAX_ENTRIES:
+        for expired in [k for k, entry in _METADATA_CACHE.items() if entry[0] <= now]:
+            del _METADATA_CACHE[expired]
+        while len(_METADATA_CACHE) >= METADATA_CACHE_MAX_ENTRIES:
+            del _METADATA_CACHE[next(iter(_METADATA_CACHE))]
+    _METADATA_CACHE[key] = (expires_at, value)
+
+
+def _ttl_cache(seconds: int) -> Callable:
+    """Cache a TrinoClient metadata method's result for a number of seconds.
+    
+    Entries are keyed by the client's connection config, the method and its
+    arguments. Expired entries are dropped when looked up, or swept when the
+    cache reaches METADATA_CACHE_MAX_ENTRIES. Passing refresh=True to the
+    decorated method skips the lookup and stores the fresh result.
+    """
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, refresh: bool = False, **kwargs):
+            key = (
+                _pool_key(self.config),
+                method.__name__,
+                args,
+                tuple(sorted(kwargs.items()))
+            )
+            now = time.monotonic()
+            with _METADATA_CACHE_LOCK:
+                entry = _METADATA_CACHE.get(key)
+                if entry is not None:
+                    if entry[0] > now and not refresh:
+                        return list(entry[1])
+                    del _METADATA_CACHE[key]
+            
+            value = method(self, *args, **kwargs)
+            with _METADATA_CACHE_LOCK:
+                _store_metadata(key, now + seconds, value, time.monotonic())
+            return list(value)
+        return wrapper
+    return decorator
+
+
+def close_pooled_connections():
+    """Close every idle pooled connection (e.g. on shutdown)."""
+    with _POOL_LOCK:
+        pools = list(_POOL.values())
+        _POOL.clear()
+    for pool in pools:
+        while True:
+            try:
+                connection, _ = pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+
+# Shared column-name tuples so identical result shapes reuse one object
+INTERNED_COLUMNS_MAX = 1024
+_INTERNED_COLUMNS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _intern_columns(columns: List[str]) -> Tuple[str, ...]:
+    """Return a shared tuple for a list of column names."""
+    key = tuple(columns)
+    interned = _INTERNED_COLUMNS.get(key)
+    if interned is not None:
+        return interned
+    if len(_INTERNED_COLUMNS) < INTERNED_COLUMNS_MAX:
+        _INTERNED_COLUMNS[key] = key
+    return key
+
+
 class TrinoQueryResult:
     """Result of a Trino query execution."""
     
+    __slots__ = (
+        "query", "columns", "data", "rows_returned", "execution_time_ms",
+        "query_id", "error", "success"
+    )
+    
     def __init__(
         self,
         query: str,
@@ -38,7 +214,7 @@ class TrinoQueryResult:
         error: Optional[str] = None
     ):
         self.query = query
-        self.columns = columns
+        self.columns = _intern_columns(columns)
         self.data = data
         self.rows_returned = rows_returned
         self.execution_time_ms = execution_time_ms
@@ -61,10 +237,28 @@ class TrinoQueryResult:
     
     def to_records(self) -> List[Dict[str, Any]]:
         """Convert data to list of records (dict format)."""
-        return [
-            {col: row[i] for i, col in enumerate(self.columns)}
-            for row in self.data
-        ]
+        columns = self.columns
+        return [dict(zip(columns, row)) for row in self.data]
+    
+    def to_columns(self) -> Dict[str, List[Any]]:
+        """Convert data to column-oriented format ({column: values}).
+        
+        Transposes the rows once; cheaper than to_records for wide or large
+        results and maps directly onto Arrow/pandas columns.
+        """
+        columns = self.columns
+        if not self.data:
+            return {col: [] for col in columns}
+        return dict(zip(columns, map(list, zip(*self.data))))
+    
+    def to_arrow(self):
+        """Convert data to a pyarrow Table.
+        
+        Returns:
+            pyarrow.Table built from to_columns()
+        """
+        import pyarrow as pa
+        return pa.Table.from_pydict(self.to_columns())
 
 
 class TrinoClient:
@@ -76,15 +270,25 @@ class TrinoClient:
         Args:
             config: Trino configuration. If None, uses default config.
         """
-        if not TRINO_AVAILABLE:
+        if not _import_trino():
             raise TrinoError("Trino library not available. Install with: pip install trino")
         
         self.config = config or TrinoConfig()
         self.connection = None
+        # Set once user SQL has run: USE/SET SESSION/SET ROLE and prepared
+        # statements change the connection's session, so it is not pooled
+        self._session_modified = False
         self._ensure_connection()
     
     def _ensure_connection(self):
-        """Ensure Trino connection is established."""
+        """Ensure Trino connection is established.
+        
+        Reuses an idle pooled connection for the same configuration when
+        one is available, so per-request clients skip the handshake.
+        """
+        if self.connection is None:
+            self.connection = self._acquire_pooled_connection()
+            self._session_modified = False
         if self.connection is None:
             try:
                 self.connection = trino.dbapi.connect(
@@ -136,7 +340,10 @@ class TrinoClient:
             cursor = self.connection.cursor()
             
             # Execute query
+            self._session_modified = True
             cursor.execute(query)
+            if query.lstrip().upper().startswith(_DDL_PREFIXES):
+                self.invalidate_metadata()
             
             # Get query ID if available
             try:
@@ -146,10 +353,8 @@ class TrinoClient:
             
             # Fetch results
             columns = [desc[0] for desc in cursor.description] if cursor.description else []
-            rows = cursor.fetchmany(max_rows or 1000)
-            
-            # Convert rows to list
-            data = [list(row) for row in rows]
+            # Rows are returned as fetched; no per-row copy
+            data = cursor.fetchmany(max_rows or 1000)
             
             execution_time = (time.time() - start_time) * 1000  # Convert to milliseconds
             
@@ -177,9 +382,46 @@ class TrinoClient:
         except Exception as e:
             raise TrinoError(f"Query execution failed: {str(e)}")
     
+    def execute_query_iter(
+        self,
+        query: str,
+        batch_size: int = 1000
+    ) -> Iterator[List[List[Any]]]:
+        """Execute a SQL query and stream the result in batches.
+        
+        Unlike execute_query, rows are never materialized all at once:
+        each batch comes from a separate fetchmany call, so callers that
+        stream to a response or file keep memory bounded.
+        
+        Args:
+            query: SQL query to execute
+            batch_size: Rows per fetchmany batch
+            
+        Yields:
+            Lists of rows
+            
+        Raises:
+            TrinoError: If query execution fails
+        """
+        try:
+            cursor = self.connection.cursor()
+            self._session_modified = True
+            cursor.execute(query)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield rows
+        except Exception as e:
+            raise TrinoError(f"Query execution failed: {str(e)}")
+    
+    @_ttl_cache(METADATA_CACHE_TTL_SECONDS)
     def list_catalogs(self) -> List[TrinoCatalogInfo]:
         """List all available catalogs.
         
+        Served from the metadata cache; pass refresh=True to query the
+        server regardless (e.g. for health checks).
+        
         Returns:
             List of catalog information
             
@@ -193,7 +435,7 @@ class TrinoClient:
             
             catalogs = []
             for row in rows:
-                catalogs.append(TrinoCatalogInfo(
+                catalogs.append(TrinoCatalogInfo.model_construct(
                     catalog_name=row[0],
                     connector_name=row[1] if len(row) > 1 else None
                 ))
@@ -203,6 +445,7 @@ class TrinoClient:
         except Exception as e:
             raise TrinoError(f"Failed to list catalogs: {str(e)}")
     
+    @_ttl_cache(METADATA_CACHE_TTL_SECONDS)
     def list_schemas(self, catalog: Optional[str] = None) -> List[TrinoSchemaInfo]:
         """List schemas in a catalog.
         
@@ -218,12 +461,12 @@ class TrinoClient:
         try:
             catalog = catalog or self.config.catalog
             cursor = self.connection.cursor()
-            cursor.execute(f"SHOW SCHEMAS FROM {catalog}")
+            cursor.execute(f"SHOW SCHEMAS FROM {_quote_ident(catalog)}")
             rows = cursor.fetchall()
             
             schemas = []
             for row in rows:
-                schemas.append(TrinoSchemaInfo(
+                schemas.append(TrinoSchemaInfo.model_construct(
                     catalog=catalog,
                     schema=row[0]
                 ))
@@ -233,6 +476,7 @@ class TrinoClient:
         except Exception as e:
             raise TrinoError(f"Failed to list schemas: {str(e)}")
     
+    @_ttl_cache(METADATA_CACHE_TTL_SECONDS)
     def list_tables(
         self,
         catalog: Optional[str] = None,
@@ -254,12 +498,12 @@ class TrinoClient:
             catalog = catalog or self.config.catalog
             schema = schema or self.config.schema
             cursor = self.connection.cursor()
-            cursor.execute(f"SHOW TABLES FROM {catalog}.{schema}")
+            cursor.execute(f"SHOW TABLES FROM {_quote_ident(catalog)}.{_quote_ident(schema)}")
             rows = cursor.fetchall()
             
             tables = []
             for row in rows:
-                tables.append(TrinoTableInfo(
+                tables.append(TrinoTableInfo.model_construct(
                     catalog=catalog,
                     schema=schema,
                     table=row[0],
@@ -283,6 +527,7 @@ class TrinoClient:
         except Exception as e:
             raise TrinoError(f"Failed to list tables: {str(e)}")
     
+    @_ttl_cache(DESCRIBE_CACHE_TTL_SECONDS)
     def describe_table(
         self,
         table_name: str,
@@ -306,12 +551,14 @@ class TrinoClient:
             catalog = catalog or self.config.catalog
             schema = schema or self.config.schema
             cursor = self.connection.cursor()
-            cursor.execute(f"DESCRIBE {catalog}.{schema}.{table_name}")
+            cursor.execute(
+                f"DESCRIBE {_quote_ident(catalog)}.{_quote_ident(schema)}.{_quote_ident(table_name)}"
+            )
             rows = cursor.fetchall()
             
             columns = []
             for row in rows:
-                columns.append(TrinoColumnInfo(
+                columns.append(TrinoColumnInfo.model_construct(
                     name=row[0],
                     type=row[1],
                     comment=row[2] if len(row) > 2 else None
@@ -322,14 +569,65 @@ class TrinoClient:
         except Exception as e:
             raise TrinoError(f"Failed to describe table: {str(e)}")
     
-    def close(self):
-        """Close Trino connection."""
-        if self.connection:
+    def invalidate_metadata(self):
+        """Drop cached catalog/schema/table metadata for this server.
+        
+        DDL is visible to every client of the server whatever its catalog,
+        schema or user, so entries are dropped by host and port rather than
+        by the full connection config. Called automatically after DDL run
+        through execute_query; call it directly after schema changes made
+        elsewhere.
+        """
+        server = (self.config.host, self.config.port)
+        with _METADATA_CACHE_LOCK:
+            for key in [k for k in _METADATA_CACHE if k[0][:2] == server]:
+                del _METADATA_CACHE[key]
+    
+    def _acquire_pooled_connection(self):
+        """Take an idle connection for this config from the pool, if any."""
+        pool = _get_pool(_pool_key(self.config))
+        while True:
             try:
-                self.connection.close()
+                connection, released_at = pool.get_nowait()
+            except queue.Empty:
+                return None
+            
+            idle = time.monotonic() - released_at
+            if idle <= POOL_PING_IDLE_SECONDS or _is_alive(connection):
+                return connection
+            
+            try:
+                connection.close()
             except:
                 pass
+    
+    def close(self, discard: bool = False):
+        """Release Trino connection back to the pool.
+        
+        Only connections used by the metadata helpers are pooled. One that
+        ran SQL through execute_query/execute_query_iter may carry a changed
+        catalog, schema, session or role, so it is closed, as is any
+        connection when the pool for this configuration is already full.
+        
+        Args:
+            discard: Close the connection instead of pooling it
+        """
+        if self.connection:
+            pooled = False
+            if not (discard or self._session_modified):
+                pool = _get_pool(_pool_key(self.config))
+                try:
+                    pool.put_nowait((self.connection, time.monotonic()))
+                    pooled = True
+                except queue.Full:
+                    pass
+            if not pooled:
+                try:
+                    self.connection.close()
+                except:
+                    pass
             self.connection = None
+            self._session_modified = False
     
     def __enter__(self):
         """Context manager entry."""
@@ -337,6 +635,6 @@ class TrinoClient:
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        self.close()
+        """Context manager exit; a connection that saw an error is not pooled."""
+        self.close(discard=exc_type is not None)
 
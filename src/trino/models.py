@@ -2,11 +2,13 @@
 Trino client models and configuration.
 """
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TrinoConfig(BaseModel):
     """Trino server configuration."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     host: str = Field(default="localhost", description="Trino coordinator host")
     port: int = Field(default=8080, description="Trino coordinator port")
     user: str = Field(default="admin", description="Trino user")
@@ -25,6 +27,8 @@ class TrinoConfig(BaseModel):
 
 class TrinoQueryRequest(BaseModel):
     """Request model for Trino queries."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     sql: str = Field(..., description="SQL query to execute")
     catalog: Optional[str] = Field(None, description="Catalog name (overrides default)")
     schema: Optional[str] = Field(None, description="Schema name (overrides default)")
@@ -35,6 +39,8 @@ class TrinoQueryRequest(BaseModel):
 
 class TrinoTableInfo(BaseModel):
     """Information about a Trino table."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     catalog: str = Field(..., description="Catalog name")
     schema: str = Field(..., description="Schema name")
     table: str = Field(..., description="Table name")
@@ -44,18 +50,24 @@ class TrinoTableInfo(BaseModel):
 
 class TrinoSchemaInfo(BaseModel):
     """Information about a Trino schema."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     catalog: str = Field(..., description="Catalog name")
     schema: str = Field(..., description="Schema name")
 
 
 class TrinoCatalogInfo(BaseModel):
     """Information about a Trino catalog."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     catalog_name: str = Field(..., description="Catalog name")
     connector_name: Optional[str] = Field(None, description="Connector name")
 
 
 class TrinoColumnInfo(BaseModel):
     """Information about a table column."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     name: str = Field(..., description="Column name")
     type: str = Field(..., description="Column type")
     comment: Optional[str] = Field(None, description="Column comment")
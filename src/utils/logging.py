@@ -4,15 +4,143 @@ Logging utility module for Morphix.
 Provides JSON-structured logging with correlation ID propagation for distributed tracing.
 """
 
+import atexit
+import copy
 import json
 import logging
-import uuid
-from typing import Optional, Dict, Any
-from datetime import datetime
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, Dict, Any, List, Tuple
 from contextvars import ContextVar
 
-# Context variable for correlation ID propagation
-_correlation_id: ContextVar[Optional[str]] = ContextVar('correlation_id', default=None)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    # datetime, UUID, dataclasses and (with SERIALIZE_NUMPY) numpy scalars and
+    # arrays are encoded in C; default=str only runs for the remaining types
+    # such as Decimal or Path
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    # Log lines get their newline from the encoder instead of a concatenation
+    _ORJSON_LINE_OPTIONS = _ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE
+
+# Correlation ID storage. The ContextVar default follows asyncio tasks;
+# MORPHIX_USE_CONTEXTVAR=0 selects a cheaper thread-local for purely
+# threaded services. Async code must keep the default, since all tasks on
+# an event loop thread would share one thread-local ID.
+_USE_CONTEXTVAR = os.environ.get('MORPHIX_USE_CONTEXTVAR', '1') == '1'
+
+if _USE_CONTEXTVAR:
+    _correlation_id: ContextVar[Optional[str]] = ContextVar('correlation_id', default=None)
+    _get_correlation_id = _correlation_id.get
+    _set_correlation_id = _correlation_id.set
+else:
+    _correlation_tls = threading.local()
+    
+    def _get_correlation_id() -> Optional[str]:
+        return getattr(_correlation_tls, 'correlation_id', None)
+    
+    def _set_correlation_id(correlation_id: Optional[str]) -> None:
+        _correlation_tls.correlation_id = correlation_id
+
+# JSON records never include thread/process fields, so skip collecting them
+# (os.getpid, threading.current_thread, ...) on every LogRecord
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Formatted log lines are batched up to this many characters per stderr write
+LOG_BUFFER_SIZE = 65536
+
+# Call sites whose serialized static fields are kept for reuse
+STATIC_FRAGMENT_CACHE_SIZE = 4096
+
+# Fields spliced into the output as pre-serialized text
+_SPLICED_KEYS = frozenset(('timestamp', 'level', 'logger', 'module', 'function', 'line'))
+
+# (levelname, name, module, funcName, lineno) -> b'"level":...,"line":N'
+_static_fragment_cache: "OrderedDict[Tuple[Any, ...], bytes]" = OrderedDict()
+
+# (epoch second, "%Y-%m-%dT%H:%M:%S" string) of the last formatted timestamp
+_timestamp_second_cache: Tuple[int, str] = (-1, "")
+
+
+def _format_timestamp(created: float) -> str:
+    """Format a LogRecord creation time as ISO-8601 UTC with a Z suffix.
+    
+    The date/time prefix is formatted once per second and reused, so
+    records logged in the same second only format the microseconds.
+    """
+    global _timestamp_second_cache
+    micros = int(created * 1_000_000)
+    seconds, micros = divmod(micros, 1_000_000)
+    cached_second, prefix = _timestamp_second_cache
+    if seconds != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _timestamp_second_cache = (seconds, prefix)
+    return f"{prefix}.{micros:06d}Z"
+
+
+def _dumps(data: Dict[str, Any], newline: bool = False) -> bytes:
+    """Serialize a log dict to UTF-8 JSON bytes, optionally newline-terminated."""
+    if ORJSON_AVAILABLE:
+        try:
+            if newline:
+                return orjson.dumps(data, default=str, option=_ORJSON_LINE_OPTIONS)
+            return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles them
+            pass
+    # Compact separators: same output shape as orjson, fewer bytes per line
+    text = json.dumps(data, default=str, separators=(',', ':'))
+    return (text + '\n' if newline else text).encode('utf-8')
+
+
+def _static_fields(record: logging.LogRecord) -> Dict[str, Any]:
+    """Fields of a record that only depend on its call site."""
+    return {
+        'level': record.levelname,
+        'logger': record.name,
+        'module': record.module,
+        'function': record.funcName,
+        'line': record.lineno,
+    }
+
+
+def _static_fragment(record: logging.LogRecord) -> bytes:
+    """Serialized call-site fields (without braces), cached per call site."""
+    key = (record.levelname, record.name, record.module, record.funcName, record.lineno)
+    fragment = _static_fragment_cache.get(key)
+    if fragment is not None:
+        try:
+            _static_fragment_cache.move_to_end(key)
+        except KeyError:
+            # Evicted by another thread formatting concurrently
+            pass
+        return fragment
+    
+    fragment = _dumps(_static_fields(record))[1:-1]
+    _static_fragment_cache[key] = fragment
+    if len(_static_fragment_cache) > STATIC_FRAGMENT_CACHE_SIZE:
+        _static_fragment_cache.popitem(last=False)
+    return fragment
+
+
+def _new_correlation_id() -> str:
+    """Generate a random 128-bit ID in the 8-4-4-4-12 UUID layout.
+    
+    Formats os.urandom bytes directly rather than constructing a
+    uuid.UUID; the ID is random but carries no UUID version bits.
+    """
+    h = os.urandom(16).hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 
 def get_correlation_id() -> Optional[str]:
@@ -21,27 +149,37 @@ def get_correlation_id() -> Optional[str]:
     Returns:
         Current correlation ID or None if not set
     """
-    return _correlation_id.get()
+    return _get_correlation_id()
 
 
 def set_correlation_id(correlation_id: Optional[str] = None) -> str:
     """Set correlation ID in context.
     
     Args:
-        correlation_id: Optional correlation ID. If None, generates a new UUID.
+        correlation_id: Optional correlation ID. If None, generates a new random ID.
         
     Returns:
         The correlation ID that was set
     """
     if correlation_id is None:
-        correlation_id = str(uuid.uuid4())
-    _correlation_id.set(correlation_id)
+        correlation_id = _new_correlation_id()
+    _set_correlation_id(correlation_id)
     return correlation_id
 
 
 def clear_correlation_id():
     """Clear the correlation ID from context."""
-    _correlation_id.set(None)
+    _set_correlation_id(None)
+
+
+class _FormatScratch(threading.local):
+    """Per-thread dict reused by JSONFormatter for the per-record fields."""
+    
+    def __init__(self):
+        self.log_data: Dict[str, Any] = {}
+
+
+_format_scratch = _FormatScratch()
 
 
 class JSONFormatter(logging.Formatter):
@@ -56,38 +194,225 @@ class JSONFormatter(logging.Formatter):
         Returns:
             JSON-formatted log string
         """
-        log_data: Dict[str, Any] = {
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
-            'level': record.levelname,
-            'logger': record.name,
-            'message': record.getMessage(),
-            'module': record.module,
-            'function': record.funcName,
-            'line': record.lineno,
-        }
-        
-        # Add correlation ID if available
-        correlation_id = get_correlation_id()
+        return self.format_bytes(record).decode('utf-8')
+    
+    def format_bytes(self, record: logging.LogRecord, newline: bool = False) -> bytes:
+        """Format log record as UTF-8 JSON bytes.
+        
+        Used by handlers that write to a binary stream, skipping the
+        bytes -> str -> bytes round trip of format().
+        
+        Args:
+            record: Log record to format
+            newline: Terminate the line with a newline written by the encoder
+            
+        Returns:
+            JSON-formatted log bytes
+        """
+        log_data = _format_scratch.log_data
+        if log_data:
+            # Re-entered while this thread's dict is in use (e.g. a __str__
+            # called by the encoder logged something): use a fresh one
+            return self._encode(record, {}, newline)
+        try:
+            return self._encode(record, log_data, newline)
+        finally:
+            # Emptied after use so it holds no references between records
+            log_data.clear()
+    
+    def _encode(self, record: logging.LogRecord, log_data: Dict[str, Any],
+                newline: bool) -> bytes:
+        """Fill log_data with the per-record fields and serialize the record."""
+        timestamp = _format_timestamp(record.created)
+        log_data['message'] = record.getMessage()
+        
+        # Add correlation ID if available (captured at log time for queued records)
+        correlation_id = getattr(record, 'correlation_id', None) or _get_correlation_id()
         if correlation_id:
             log_data['correlation_id'] = correlation_id
         
         # Add exception info if present
         if record.exc_info:
             log_data['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_data['exception'] = record.exc_text
+        
+        # Add structured fields passed as extra={'extra_fields': {...}} (see log_json).
+        # logging copies extra= keys onto the record itself; it never sets record.extra
+        extra_fields = getattr(record, 'extra_fields', None)
+        if extra_fields:
+            log_data.update(extra_fields)
         
-        # Add extra fields from record (check both extra_fields attribute and extra dict)
-        if hasattr(record, 'extra_fields'):
-            log_data.update(record.extra_fields)
-        # Also check if extra dict was passed via logging call
-        if hasattr(record, 'extra') and isinstance(record.extra, dict):
-            log_data.update(record.extra)
+        if not _SPLICED_KEYS.isdisjoint(log_data):
+            # Extra fields override built-in ones: build the whole object
+            return _dumps({'timestamp': timestamp, **_static_fields(record), **log_data}, newline)
+        
+        # The timestamp needs no escaping and the call-site fields are cached,
+        # so only the per-record fields go through the encoder
+        return b''.join((
+            b'{"timestamp":"', timestamp.encode('ascii'), b'",',
+            _static_fragment(record), b',', _dumps(log_data, newline)[1:]
+        ))
+
+
+class _JSONQueueHandler(QueueHandler):
+    """QueueHandler that defers JSON formatting to the listener thread."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Resolve call-site state before the record changes threads.
         
-        return json.dumps(log_data, default=str)
+        Message arguments, the traceback and the correlation ID are only
+        valid on the logging thread, so they are resolved here; building
+        and writing the JSON happens on the listener.
+        """
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = self.formatter.formatException(record.exc_info)
+            record.exc_info = None
+        correlation_id = _get_correlation_id()
+        if correlation_id:
+            record.correlation_id = correlation_id
+        return record
+
+
+class _BatchingStreamHandler(logging.StreamHandler):
+    """StreamHandler that coalesces formatted lines into few large writes.
+    
+    StreamHandler flushes after every record, which costs a write syscall
+    per log line. Lines are held here until flush(), which the listener
+    calls whenever the queue runs dry or LOG_BUFFER_SIZE is reached. Lines
+    are kept as bytes and written to the stream's binary buffer when it
+    has one, so JSONFormatter output is never decoded and re-encoded.
+    """
+    
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        self._pending: List[bytes] = []
+        self._pending_size = 0
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Format a record and hold it for the next batched write."""
+        try:
+            format_bytes = getattr(self.formatter, 'format_bytes', None)
+            if format_bytes is not None:
+                line = format_bytes(record, newline=True)
+            else:
+                line = (self.format(record) + self.terminator).encode('utf-8')
+            self._pending.append(line)
+            self._pending_size += len(line)
+            if self._pending_size >= LOG_BUFFER_SIZE:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self) -> None:
+        """Write all held lines in one call and flush the stream."""
+        self.acquire()
+        try:
+            if self._pending:
+                data = b''.join(self._pending)
+                self._pending.clear()
+                self._pending_size = 0
+                buffer = getattr(self.stream, 'buffer', None)
+                if buffer is not None:
+                    # Push out text already written to the stream to keep order
+                    self.stream.flush()
+                    buffer.write(data)
+                else:
+                    self.stream.write(data.decode('utf-8'))
+            if self.stream and hasattr(self.stream, "flush"):
+                self.stream.flush()
+        finally:
+            self.release()
+
+
+class _FlushingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers before waiting for records."""
+    
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        """Get the next record, flushing batched output if none is waiting."""
+        if block and self.queue.empty():
+            self._flush_handlers()
+        return self.queue.get(block)
+    
+    def stop(self) -> None:
+        """Drain the queue, stop the thread and flush what remains."""
+        super().stop()
+        self._flush_handlers()
+    
+    def _flush_handlers(self) -> None:
+        """Flush every handler, ignoring streams closed under us (as logging.shutdown does)."""
+        for handler in self.handlers:
+            try:
+                handler.flush()
+            except (OSError, ValueError):
+                pass
+
+
+# Records from every JSON logger go through one queue to a single writer thread
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_listener: Optional[QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+def _ensure_listener() -> None:
+    """Start the background thread writing queued records to stderr."""
+    global _listener
+    if _listener is not None:
+        return
+    with _listener_lock:
+        if _listener is None:
+            stream_handler = _BatchingStreamHandler()
+            stream_handler.setFormatter(JSONFormatter())
+            listener = _FlushingQueueListener(_log_queue, stream_handler)
+            listener.start()
+            # Drain queued records before the interpreter exits
+            atexit.register(listener.stop)
+            _listener = listener
+
+
+# Loggers already configured by get_logger, keyed by name
+_logger_cache: Dict[str, logging.Logger] = {}
+_logger_cache_lock = threading.Lock()
+
+
+def _reinit_after_fork() -> None:
+    """Give a forked child its own queue and writer thread.
+    
+    The child inherits _listener but not its thread, so records queued
+    there would never be written. Records the parent had not written yet
+    are left to the parent rather than duplicated.
+    """
+    global _log_queue, _listener, _listener_lock, _logger_cache_lock
+    _log_queue = queue.SimpleQueue()
+    _listener_lock = threading.Lock()
+    _logger_cache_lock = threading.Lock()
+    
+    inherited, _listener = _listener, None
+    if inherited is None:
+        return
+    atexit.unregister(inherited.stop)
+    for logger in _logger_cache.values():
+        for handler in logger.handlers:
+            if isinstance(handler, _JSONQueueHandler):
+                handler.queue = _log_queue
+    _ensure_listener()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reinit_after_fork)
 
 
 def get_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     """Get a JSON logger with correlation ID propagation.
     
+    Repeat calls are served from a module-level registry without going
+    through logging.getLogger; the first call for a name is serialized so
+    concurrent callers cannot attach two handlers.
+    
     Args:
         name: Logger name (typically __name__)
         level: Logging level (default: INFO)
@@ -95,35 +420,69 @@ def get_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     Returns:
         Configured logger instance
     """
-    logger = logging.getLogger(name)
-    
-    # Avoid adding handlers multiple times
-    if logger.handlers:
+    logger = _logger_cache.get(name)
+    if logger is not None:
         return logger
     
-    logger.setLevel(level)
-    
-    # Create console handler with JSON formatter
-    handler = logging.StreamHandler()
-    handler.setLevel(level)
-    handler.setFormatter(JSONFormatter())
+    with _logger_cache_lock:
+        logger = _logger_cache.get(name)
+        if logger is not None:
+            return logger
+        
+        logger = logging.getLogger(name)
+        
+        # Loggers configured elsewhere keep their handlers
+        if not logger.handlers:
+            logger.setLevel(level)
+            
+            # Enqueue records; JSON formatting and the stderr write happen on the
+            # listener thread so logging calls do not block on I/O
+            _ensure_listener()
+            handler = _JSONQueueHandler(_log_queue)
+            handler.setLevel(level)
+            handler.setFormatter(JSONFormatter())
+            
+            logger.addHandler(handler)
+            logger.propagate = False  # Prevent duplicate logs from parent loggers
+        
+        _logger_cache[name] = logger
+        return logger
+
+
+def log_json(logger: logging.Logger, level: int, msg: str, **fields: Any) -> None:
+    """Log a message with structured fields, doing no work if the level is off.
     
-    logger.addHandler(handler)
-    logger.propagate = False  # Prevent duplicate logs from parent loggers
+    Preferred over logger.log(level, msg, extra={'extra_fields': {...}}) on
+    hot paths: the fields dict is only built into a record when the logger
+    is enabled for the level.
     
-    return logger
+    Args:
+        logger: Logger from get_logger
+        level: Logging level (e.g. logging.DEBUG)
+        msg: Log message
+        **fields: Fields added to the JSON record
+    """
+    if logger.isEnabledFor(level):
+        logger.log(level, msg, extra={'extra_fields': fields}, stacklevel=2)
 
 
 class CorrelationContext:
     """Context manager for correlation ID propagation."""
     
-    def __init__(self, correlation_id: Optional[str] = None):
+    __slots__ = ('correlation_id', 'inherit_if_present', '_previous_id')
+    
+    def __init__(self, correlation_id: Optional[str] = None, inherit_if_present: bool = True):
         """Initialize correlation context.
         
         Args:
-            correlation_id: Optional correlation ID. If None, generates a new UUID.
+            correlation_id: Optional correlation ID. If None, the enclosing
+                context's ID is kept (see inherit_if_present) or a new random
+                ID is generated.
+            inherit_if_present: Reuse an already-set correlation ID instead of
+                generating a new one when correlation_id is None
         """
         self.correlation_id = correlation_id
+        self.inherit_if_present = inherit_if_present
         self._previous_id: Optional[str] = None
     
     def __enter__(self) -> str:
@@ -133,6 +492,9 @@ class CorrelationContext:
             The correlation ID
         """
         self._previous_id = get_correlation_id()
+        if self.correlation_id is None and self.inherit_if_present and self._previous_id is not None:
+            # Nested context without its own ID: nothing to generate or set
+            return self._previous_id
         return set_correlation_id(self.correlation_id)
     
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -0,0 +1,120 @@
+"""Shared container fixtures for integration tests.
+
+Containers are session-scoped so every integration module reuses one
+MongoDB replica set and one PostgreSQL instance. Tests are isolated by
+unique collection names, so they can also run in parallel:
+
+    pytest tests/integration -n auto
+
+Each xdist worker is its own session and starts its own containers unless
+MORPHIX_TEST_MONGO_URI / MORPHIX_TEST_POSTGRES_URL point at servers that
+were started once for the whole run.
+"""
+
+import os
+import time
+import uuid
+
+import pytest
+import pymongo
+
+# Skip container-backed tests if testcontainers not available
+try:
+    from testcontainers.mongodb import MongoDbContainer
+    from testcontainers.postgres import PostgresContainer
+    TESTCONTAINERS_AVAILABLE = True
+except ImportError:
+    TESTCONTAINERS_AVAILABLE = False
+
+# Externally managed servers shared by every worker, if set
+MONGO_URI = os.getenv("MORPHIX_TEST_MONGO_URI")
+POSTGRES_URL = os.getenv("MORPHIX_TEST_POSTGRES_URL")
+
+REPLICA_SET_TIMEOUT = 30  # Seconds to wait for the replica set to elect a primary
+REPLICA_SET_POLL_INTERVAL = 0.2
+
+
+def _wait_for_primary(container, timeout: float = REPLICA_SET_TIMEOUT) -> bool:
+    """Poll rs.status() until the single member reports PRIMARY.
+    
+    Args:
+        container: Docker container running mongod
+        timeout: Maximum seconds to wait
+    
+    Returns:
+        True if the member became primary before the timeout
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        result = container.exec_run([
+            "mongosh", "--quiet", "--eval", "rs.status().myState"
+        ])
+        if result.exit_code == 0 and result.output.strip() == b"1":
+            return True
+        time.sleep(REPLICA_SET_POLL_INTERVAL)
+    return False
+
+
+@pytest.fixture(scope="session")
+def mongodb():
+    """MongoDB container with replica set."""
+    if not TESTCONTAINERS_AVAILABLE:
+        pytest.skip("testcontainers not available")
+    
+    with MongoDbContainer("mongo:6.0") as mongo:
+        # Enable replica set (required for changestreams)
+        try:
+            container = mongo.get_container()
+            container.exec_run([
+                "mongosh", "--eval",
+                "rs.initiate({_id:'rs0',members:[{_id:0,host:'localhost:27017'}]})"
+            ])
+            if not _wait_for_primary(container):
+                print("Replica set init warning: no primary elected")
+        except Exception as e:
+            # If replica set init fails, try alternative approach
+            print(f"Replica set init warning: {e}")
+        
+        yield mongo
+
+
+@pytest.fixture(scope="session")
+def postgres():
+    """PostgreSQL container."""
+    if not TESTCONTAINERS_AVAILABLE:
+        pytest.skip("testcontainers not available")
+    
+    with PostgresContainer("postgres:15") as pg:
+        yield pg
+
+
+@pytest.fixture(scope="session")
+def mongodb_uri(request):
+    """Connection URI of the external MongoDB server, else of the container."""
+    if MONGO_URI:
+        return MONGO_URI
+    return request.getfixturevalue("mongodb").get_connection_url()
+
+
+@pytest.fixture(scope="session")
+def postgres_url(request):
+    """Connection URL of the external PostgreSQL server, else of the container."""
+    if POSTGRES_URL:
+        return POSTGRES_URL
+    return request.getfixturevalue("postgres").get_connection_url()
+
+
+@pytest.fixture(scope="session")
+def mongodb_client(mongodb_uri):
+    """MongoDB client shared by every test in the session."""
+    client = pymongo.MongoClient(mongodb_uri)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def test_collection(mongodb_client):
+    """Uniquely named collection, dropped after the test."""
+    collection = mongodb_client["testdb"][f"test_collection_{uuid.uuid4().hex}"]
+    yield collection
+    collection.drop()
@@ -3,6 +3,7 @@
 import pytest
 import time
 import threading
+import uuid
 from datetime import datetime
 from typing import Dict, Any, List
 
@@ -14,74 +15,12 @@ from src.connectors.cdc.mongo_changestream import ChangeStreamWatcher, CDCConfig
 from src.connectors.cdc.checkpoint_store import CheckpointStore
 from src.jobs.stream_jobs import StreamJobProcessor
 from src.jobs.models import StreamJobConfig, JobSchedule, JobTrigger
-import pymongo
-
-
-# Skip integration tests if testcontainers not available
-try:
-    from testcontainers.mongodb import MongoDbContainer
-    from testcontainers.postgres import PostgresContainer
-    TESTCONTAINERS_AVAILABLE = True
-except ImportError:
-    TESTCONTAINERS_AVAILABLE = False
-    pytestmark = pytest.mark.skip("testcontainers not available")
-
-
-@pytest.fixture(scope="module")
-def mongodb():
-    """MongoDB container with replica set."""
-    if not TESTCONTAINERS_AVAILABLE:
-        pytest.skip("testcontainers not available")
-    
-    with MongoDbContainer("mongo:6.0") as mongo:
-        # Enable replica set (required for changestreams)
-        try:
-            mongo.get_container().exec_run([
-                "mongosh", "--eval",
-                "rs.initiate({_id:'rs0',members:[{_id:0,host:'localhost:27017'}]})"
-            ])
-            time.sleep(5)  # Wait for replica set
-        except Exception as e:
-            # If replica set init fails, try alternative approach
-            print(f"Replica set init warning: {e}")
-        
-        yield mongo
-
-
-@pytest.fixture(scope="module")
-def postgres():
-    """PostgreSQL container."""
-    if not TESTCONTAINERS_AVAILABLE:
-        pytest.skip("testcontainers not available")
-    
-    with PostgresContainer("postgres:15") as pg:
-        yield pg
-
-
-@pytest.fixture
-def mongodb_client(mongodb):
-    """MongoDB client."""
-    client = pymongo.MongoClient(mongodb.get_connection_url())
-    yield client
-    client.close()
-
-
-@pytest.fixture
-def test_collection(mongodb_client):
-    """Test collection."""
-    db = mongodb_client["testdb"]
-    collection = db["test_collection"]
-    # Clear collection
-    collection.delete_many({})
-    yield collection
-    collection.delete_many({})
 
 
 @pytest.fixture
-def checkpoint_store(postgres):
+def checkpoint_store(postgres_url):
     """Checkpoint store with test database."""
-    database_url = postgres.get_connection_url()
-    store = CheckpointStore(database_url)
+    store = CheckpointStore(postgres_url)
     yield store
     store.close()
 
@@ -107,14 +46,16 @@ def test_cdc_end_to_end(mongodb_client, test_collection, checkpoint_store):
     test_collection.insert_many([
         {"_id": 1, "name": "Alice", "age": 30},
         {"_id": 2, "name": "Bob", "age": 25}
-    ])
+    ], ordered=False)
     
     # Step 2: Start CDC watcher
     config = CDCConfig(batch_size=10, batch_interval=5)
     processed_batches = []
+    processed = threading.Event()
     
     def callback(batch: List[Dict[str, Any]]):
         processed_batches.append(batch)
+        processed.set()
     
     watcher = ChangeStreamWatcher(
         collection=test_collection,
@@ -133,7 +74,7 @@ def test_cdc_end_to_end(mongodb_client, test_collection, checkpoint_store):
     
     # Step 3: Insert more documents
     test_collection.insert_one({"_id": 3, "name": "Charlie", "age": 35})
-    time.sleep(2)
+    processed.wait(timeout=2)
     
     # Step 4: Stop watcher
     watcher.stop()
@@ -151,9 +92,11 @@ def test_cdc_end_to_end(mongodb_client, test_collection, checkpoint_store):
     
     # Step 7: Restart watcher
     processed_batches_restart = []
+    processed_restart = threading.Event()
     
     def callback_restart(batch: List[Dict[str, Any]]):
         processed_batches_restart.append(batch)
+        processed_restart.set()
     
     watcher2 = ChangeStreamWatcher(
         collection=test_collection,
@@ -166,7 +109,7 @@ def test_cdc_end_to_end(mongodb_client, test_collection, checkpoint_store):
     watcher_thread2.daemon = True
     watcher_thread2.start()
     
-    time.sleep(2)
+    processed_restart.wait(timeout=2)
     watcher2.stop()
     watcher_thread2.join(timeout=5)
     
@@ -194,14 +137,17 @@ def test_cdc_crash_recovery(mongodb_client, test_collection, checkpoint_store):
     test_collection.insert_many([
         {"_id": i, "name": f"User{i}", "age": 20 + i}
         for i in range(1, 11)
-    ])
+    ], ordered=False)
     
     # Start watcher
     config = CDCConfig(batch_size=5, batch_interval=2)
     processed_records = []
+    processed = threading.Event()
     
     def callback(batch: List[Dict[str, Any]]):
         processed_records.extend(batch)
+        if len(processed_records) >= config.batch_size:
+            processed.set()
     
     watcher = ChangeStreamWatcher(
         collection=test_collection,
@@ -215,7 +161,7 @@ def test_cdc_crash_recovery(mongodb_client, test_collection, checkpoint_store):
     watcher_thread.start()
     
     # Let it process some records
-    time.sleep(3)
+    processed.wait(timeout=3)
     
     # Simulate crash (stop abruptly)
     watcher.stop()
@@ -227,9 +173,11 @@ def test_cdc_crash_recovery(mongodb_client, test_collection, checkpoint_store):
     
     # Restart watcher
     processed_records_restart = []
+    processed_restart = threading.Event()
     
     def callback_restart(batch: List[Dict[str, Any]]):
         processed_records_restart.extend(batch)
+        processed_restart.set()
     
     watcher2 = ChangeStreamWatcher(
         collection=test_collection,
@@ -242,7 +190,7 @@ def test_cdc_crash_recovery(mongodb_client, test_collection, checkpoint_store):
     watcher_thread2.daemon = True
     watcher_thread2.start()
     
-    time.sleep(2)
+    processed_restart.wait(timeout=2)
     watcher2.stop()
     watcher_thread2.join(timeout=2)
     
@@ -268,14 +216,17 @@ def test_cdc_handles_schema_changes(mongodb_client, test_collection, checkpoint_
     test_collection.insert_many([
         {"_id": 1, "name": "Alice", "age": 30},
         {"_id": 2, "name": "Bob", "age": 25}
-    ])
+    ], ordered=False)
     
     # Start watcher
     config = CDCConfig(batch_size=10, batch_interval=2)
     processed_batches = []
+    new_field_seen = threading.Event()
     
     def callback(batch: List[Dict[str, Any]]):
         processed_batches.append(batch)
+        if any('email' in change.get('fullDocument', {}) for change in batch):
+            new_field_seen.set()
     
     watcher = ChangeStreamWatcher(
         collection=test_collection,
@@ -298,7 +249,7 @@ def test_cdc_handles_schema_changes(mongodb_client, test_collection, checkpoint_
         "email": "charlie@example.com"  # New field
     })
     
-    time.sleep(2)
+    new_field_seen.wait(timeout=2)
     
     watcher.stop()
     watcher_thread.join(timeout=3)
@@ -321,16 +272,17 @@ def test_cdc_handles_schema_changes(mongodb_client, test_collection, checkpoint_
     # but it verifies the system continues processing
 
 
-def test_checkpoint_store_persistence(postgres):
+def test_checkpoint_store_persistence(postgres_url):
     """Test checkpoint store persists across restarts."""
-    database_url = postgres.get_connection_url()
+    # Unique per run so parallel workers sharing a database do not collide
+    job_id = f"test_persistence_{uuid.uuid4().hex}"
     
     # Create store and save checkpoint
-    store1 = CheckpointStore(database_url)
+    store1 = CheckpointStore(postgres_url)
     resume_token = {"_data": "test_token_123"}
     
     store1.save_checkpoint(
-        job_id="test_persistence",
+        job_id=job_id,
         collection="test_collection",
         resume_token=resume_token,
         records_processed=100
@@ -338,8 +290,8 @@ def test_checkpoint_store_persistence(postgres):
     store1.close()
     
     # Create new store instance (simulating restart)
-    store2 = CheckpointStore(database_url)
-    loaded_token = store2.load_checkpoint("test_persistence", "test_collection")
+    store2 = CheckpointStore(postgres_url)
+    loaded_token = store2.load_checkpoint(job_id, "test_collection")
     store2.close()
     
     assert loaded_token == resume_token
@@ -353,14 +305,17 @@ def test_cdc_batch_processing(mongodb_client, test_collection, checkpoint_store)
     test_collection.insert_many([
         {"_id": i, "name": f"User{i}", "age": 20 + i}
         for i in range(1, 21)
-    ])
+    ], ordered=False, bypass_document_validation=True)
     
     # Start watcher with small batch size
     config = CDCConfig(batch_size=5, batch_interval=10)
     batch_sizes = []
+    all_processed = threading.Event()
     
     def callback(batch: List[Dict[str, Any]]):
         batch_sizes.append(len(batch))
+        if sum(batch_sizes) >= 20:
+            all_processed.set()
     
     watcher = ChangeStreamWatcher(
         collection=test_collection,
@@ -373,7 +328,7 @@ def test_cdc_batch_processing(mongodb_client, test_collection, checkpoint_store)
     watcher_thread.daemon = True
     watcher_thread.start()
     
-    time.sleep(3)
+    all_processed.wait(timeout=3)
     
     watcher.stop()
     watcher_thread.join(timeout=3)
@@ -1,16 +1,61 @@
 """
 Integration tests for Trino API endpoints.
 """
+import asyncio
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 from src.api.mongo_api import app
 
 client = TestClient(app)
 
+# Read-only endpoints probed together by the gathered-response fixtures
+READ_ONLY_PATHS = (
+    "/trino/health",
+    "/trino/catalogs",
+    "/trino/schemas",
+    "/trino/tables",
+    "/trino/table/test_table/describe",
+)
+UNAUTHENTICATED_REQUESTS = (
+    ("GET", "/trino/health", None),
+    ("POST", "/trino/query", {"sql": "SELECT 1"}),
+    ("GET", "/trino/tables", None),
+)
 
-@pytest.fixture
+
+async def _request_all(requests, headers=None):
+    """Send independent requests to the app concurrently.
+    
+    The Trino endpoints are synchronous, so FastAPI runs each in its
+    threadpool and their waits on the Trino server overlap.
+    
+    Args:
+        requests: (method, path, json body or None) tuples
+        headers: Headers sent with every request
+        
+    Returns:
+        Responses keyed by (method, path)
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+        responses = await asyncio.gather(*[
+            async_client.request(method, path, json=body, headers=headers)
+            for method, path, body in requests
+        ])
+    return {(method, path): response for (method, path, _), response in zip(requests, responses)}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def app_lifespan():
+    """Run the app's startup and shutdown events once for the module."""
+    with client:
+        yield
+
+
+@pytest.fixture(scope="module")
 def auth_token():
-    """Get authentication token for tests."""
+    """Get one authentication token shared by every test in the module."""
     # Register and login a test user
     register_response = client.post(
         "/auth/register",
@@ -41,15 +86,28 @@ def auth_token():
     pytest.skip("Could not authenticate for Trino tests")
 
 
+@pytest.fixture(scope="module")
+def read_only_responses(auth_token):
+    """Responses of the authenticated read-only endpoints, fetched concurrently."""
+    responses = asyncio.run(_request_all(
+        [("GET", path, None) for path in READ_ONLY_PATHS],
+        headers={"Authorization": f"Bearer {auth_token}"}
+    ))
+    return {path: response for (_, path), response in responses.items()}
+
+
+@pytest.fixture(scope="module")
+def unauthenticated_responses():
+    """Responses of requests sent without a token, fetched concurrently."""
+    return asyncio.run(_request_all(UNAUTHENTICATED_REQUESTS))
+
+
 class TestTrinoHealth:
     """Test Trino health check endpoint."""
     
-    def test_health_check_success(self, auth_token):
+    def test_health_check_success(self, read_only_responses):
         """Test successful health check."""
-        response = client.get(
-            "/trino/health",
-            headers={"Authorization": f"Bearer {auth_token}"}
-        )
+        response = read_only_responses["/trino/health"]
         
         # Note: This will fail if Trino is not running, but tests the endpoint structure
         assert response.status_code in [200, 503]
@@ -60,12 +118,9 @@ class TestTrinoHealth:
 class TestTrinoCatalogs:
     """Test Trino catalog listing."""
     
-    def test_list_catalogs(self, auth_token):
+    def test_list_catalogs(self, read_only_responses):
         """Test listing catalogs."""
-        response = client.get(
-            "/trino/catalogs",
-            headers={"Authorization": f"Bearer {auth_token}"}
-        )
+        response = read_only_responses["/trino/catalogs"]
         
         # Note: This will fail if Trino is not running
         assert response.status_code in [200, 400, 500, 503]
@@ -78,12 +133,9 @@ class TestTrinoCatalogs:
 class TestTrinoSchemas:
     """Test Trino schema listing."""
     
-    def test_list_schemas(self, auth_token):
+    def test_list_schemas(self, read_only_responses):
         """Test listing schemas."""
-        response = client.get(
-            "/trino/schemas",
-            headers={"Authorization": f"Bearer {auth_token}"}
-        )
+        response = read_only_responses["/trino/schemas"]
         
         assert response.status_code in [200, 400, 500, 503]
         if response.status_code == 200:
@@ -105,12 +157,9 @@ class TestTrinoSchemas:
 class TestTrinoTables:
     """Test Trino table listing."""
     
-    def test_list_tables(self, auth_token):
+    def test_list_tables(self, read_only_responses):
         """Test listing tables."""
-        response = client.get(
-            "/trino/tables",
-            headers={"Authorization": f"Bearer {auth_token}"}
-        )
+        response = read_only_responses["/trino/tables"]
         
         assert response.status_code in [200, 400, 500, 503]
         if response.status_code == 200:
@@ -133,13 +182,10 @@ class TestTrinoTables:
 class TestTrinoDescribeTable:
     """Test Trino table description."""
     
-    def test_describe_table(self, auth_token):
+    def test_describe_table(self, read_only_responses):
         """Test describing a table."""
         # Note: This will fail if table doesn't exist
-        response = client.get(
-            "/trino/table/test_table/describe",
-            headers={"Authorization": f"Bearer {auth_token}"}
-        )
+        response = read_only_responses["/trino/table/test_table/describe"]
         
         assert response.status_code in [200, 400, 500, 503]
         if response.status_code == 200:
@@ -225,21 +271,18 @@ class TestTrinoQuery:
 class TestTrinoAuthentication:
     """Test Trino endpoint authentication."""
     
-    def test_health_check_no_auth(self):
+    def test_health_check_no_auth(self, unauthenticated_responses):
         """Test that health check requires authentication."""
-        response = client.get("/trino/health")
+        response = unauthenticated_responses[("GET", "/trino/health")]
         assert response.status_code == 401
     
-    def test_query_no_auth(self):
+    def test_query_no_auth(self, unauthenticated_responses):
         """Test that query requires authentication."""
-        response = client.post(
-            "/trino/query",
-            json={"sql": "SELECT 1"}
-        )
+        response = unauthenticated_responses[("POST", "/trino/query")]
         assert response.status_code == 401
     
-    def test_list_tables_no_auth(self):
+    def test_list_tables_no_auth(self, unauthenticated_responses):
         """Test that list tables requires authentication."""
-        response = client.get("/trino/tables")
+        response = unauthenticated_responses[("GET", "/trino/tables")]
         assert response.status_code == 401
 
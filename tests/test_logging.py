@@ -0,0 +1,358 @@
+"""
+Unit tests for structured logging utilities.
+"""
+
+import pytest
+import io
+import json
+import logging
+import os
+import queue
+import re
+import subprocess
+import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils import logging as morphix_logging
+from src.utils.logging import JSONFormatter, CorrelationContext
+
+
+TIMESTAMP_PATTERN = r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}Z"
+
+
+def make_record(msg="hello %s", args=("world",), exc_info=None, **attrs):
+    """Build a LogRecord the way Logger.makeRecord would."""
+    record = logging.LogRecord(
+        "morphix.test", logging.INFO, __file__, 42, msg, args, exc_info, func="handler"
+    )
+    record.__dict__.update(attrs)
+    return record
+
+
+class TestJSONFormatter:
+    """Test cases for JSONFormatter class."""
+    
+    def test_format_fields(self):
+        """Test the standard fields are emitted as one JSON object."""
+        record = make_record()
+        output = JSONFormatter().format(record)
+        data = json.loads(output)
+        
+        assert data["level"] == "INFO"
+        assert data["logger"] == "morphix.test"
+        assert data["message"] == "hello world"
+        assert data["function"] == "handler"
+        assert data["line"] == 42
+        assert re.fullmatch(TIMESTAMP_PATTERN, data["timestamp"])
+        assert "correlation_id" not in data
+    
+    def test_extra_fields_and_correlation_id(self):
+        """Test extra fields and the context correlation ID are included."""
+        record = make_record(extra_fields={"collection": "users", 7: Path("/tmp")})
+        
+        with CorrelationContext("cid-1"):
+            data = json.loads(JSONFormatter().format(record))
+        
+        assert data["correlation_id"] == "cid-1"
+        assert data["collection"] == "users"
+        assert data["7"] == "/tmp"
+    
+    def test_exception_included(self):
+        """Test formatted tracebacks are included."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = make_record(exc_info=sys.exc_info())
+        
+        data = json.loads(JSONFormatter().format(record))
+        assert "ValueError: boom" in data["exception"]
+    
+    def test_call_site_fragment_cached(self):
+        """Test repeated call sites reuse one serialized fragment."""
+        morphix_logging._static_fragment_cache.clear()
+        formatter = JSONFormatter()
+        outputs = [formatter.format(make_record("n=%d", (i,))) for i in range(3)]
+        
+        assert len(morphix_logging._static_fragment_cache) == 1
+        assert [json.loads(o)["message"] for o in outputs] == ["n=0", "n=1", "n=2"]
+        assert all(json.loads(o)["line"] == 42 for o in outputs)
+    
+    def test_extra_fields_override_builtin(self):
+        """Test extra fields may still replace built-in fields."""
+        data = json.loads(JSONFormatter().format(make_record(extra_fields={"module": "custom"})))
+        
+        assert data["module"] == "custom"
+        assert data["logger"] == "morphix.test"
+    
+    def test_scratch_dict_reused_and_cleared(self):
+        """Test the per-thread dict is emptied after each record."""
+        formatter = JSONFormatter()
+        scratch = morphix_logging._format_scratch.log_data
+        first = json.loads(formatter.format(make_record(extra_fields={"a": 1})))
+        second = json.loads(formatter.format(make_record()))
+        
+        assert first["a"] == 1
+        assert "a" not in second
+        assert morphix_logging._format_scratch.log_data is scratch
+        assert scratch == {}
+    
+    def test_reentrant_format(self):
+        """Test formatting a record while encoding another one."""
+        formatter = JSONFormatter()
+        
+        class Reentrant:
+            def __str__(self):
+                return formatter.format(make_record("inner", ()))
+        
+        data = json.loads(formatter.format(make_record(extra_fields={"value": Reentrant()})))
+        
+        assert data["message"] == "hello world"
+        assert json.loads(data["value"])["message"] == "inner"
+    
+    def test_native_types(self):
+        """Test datetimes, UUIDs and numpy values encode without str()."""
+        if not morphix_logging.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        np = pytest.importorskip("numpy")
+        fields = {
+            "at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            "id": uuid.UUID(int=1),
+            "rows": np.int64(5),
+            "ratio": np.float32(0.5),
+        }
+        data = json.loads(JSONFormatter().format(make_record(extra_fields=fields)))
+        
+        assert data["at"] == "2024-01-02T03:04:05+00:00"
+        assert data["id"] == "00000000-0000-0000-0000-000000000001"
+        assert data["rows"] == 5
+        assert data["ratio"] == 0.5
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize("extra_fields", [{}, {"line": "override"}])
+    def test_format_bytes_newline(self, monkeypatch, use_orjson, extra_fields):
+        """Test newline-terminated output from every encoding path."""
+        monkeypatch.setattr(
+            morphix_logging, "ORJSON_AVAILABLE", use_orjson and morphix_logging.ORJSON_AVAILABLE
+        )
+        record = make_record(extra_fields=extra_fields)
+        line = JSONFormatter().format_bytes(record, newline=True)
+        
+        assert line.endswith(b"}\n") and line.count(b"\n") == 1
+        assert line[:-1] == JSONFormatter().format_bytes(record)
+    
+    def test_stdlib_fallback(self, monkeypatch):
+        """Test output without orjson has the same shape."""
+        monkeypatch.setattr(morphix_logging, "ORJSON_AVAILABLE", False)
+        output = JSONFormatter().format(make_record(extra_fields={"collection": "users"}))
+        data = json.loads(output)
+        
+        assert re.fullmatch(TIMESTAMP_PATTERN, data["timestamp"])
+        assert data["collection"] == "users"
+        assert '"collection":"users"' in output
+    
+    def test_oversized_int(self):
+        """Test values orjson cannot encode fall back to the stdlib encoder."""
+        data = json.loads(JSONFormatter().format(make_record(extra_fields={"big": 2 ** 70})))
+        assert data["big"] == 2 ** 70
+
+
+
+class TestQueuedLogging:
+    """Test cases for the queue-based logger pipeline."""
+    
+    def test_get_logger_enqueues(self):
+        """Test loggers hand records to the shared queue."""
+        logger = morphix_logging.get_logger("morphix.test.queue")
+        
+        assert [type(h) for h in logger.handlers] == [morphix_logging._JSONQueueHandler]
+        assert morphix_logging._listener is not None
+    
+    def test_get_logger_cached(self):
+        """Test repeat and concurrent calls return one configured logger."""
+        name = "morphix.test.cached"
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            loggers = list(executor.map(lambda _: morphix_logging.get_logger(name), range(32)))
+        
+        assert all(logger is loggers[0] for logger in loggers)
+        assert len(loggers[0].handlers) == 1
+        
+        with patch.object(logging, "getLogger") as get_logger:
+            assert morphix_logging.get_logger(name) is loggers[0]
+        get_logger.assert_not_called()
+    
+    def test_prepare_captures_call_site_state(self):
+        """Test correlation ID and traceback survive formatting on another thread."""
+        handler = morphix_logging._JSONQueueHandler(morphix_logging._log_queue)
+        handler.setFormatter(JSONFormatter())
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            with CorrelationContext("cid-queued"):
+                queued = handler.prepare(make_record(exc_info=sys.exc_info()))
+        
+        data = json.loads(JSONFormatter().format(queued))
+        assert data["message"] == "hello world"
+        assert data["correlation_id"] == "cid-queued"
+        assert "ValueError: boom" in data["exception"]
+
+    def test_listener_batches_writes(self):
+        """Test queued records reach the stream in one write per batch."""
+        stream = io.StringIO()
+        stream.write = MagicMock(wraps=stream.write)
+        handler = morphix_logging._BatchingStreamHandler(stream)
+        handler.setFormatter(JSONFormatter())
+        records = queue.SimpleQueue()
+        for i in range(5):
+            records.put(make_record("line %d", (i,)))
+        
+        listener = morphix_logging._FlushingQueueListener(records, handler)
+        listener.start()
+        listener.stop()
+        
+        lines = stream.getvalue().splitlines()
+        assert [json.loads(line)["message"] for line in lines] == [f"line {i}" for i in range(5)]
+        assert stream.write.call_count == 1
+
+    def test_bytes_written_to_binary_buffer(self):
+        """Test lines go to the stream's binary buffer after earlier text."""
+        raw = io.BytesIO()
+        stream = io.TextIOWrapper(raw, encoding="utf-8")
+        handler = morphix_logging._BatchingStreamHandler(stream)
+        handler.setFormatter(JSONFormatter())
+        
+        stream.write("plain text\n")
+        handler.handle(make_record("caf\u00e9", ()))
+        handler.flush()
+        
+        first, second = raw.getvalue().decode("utf-8").splitlines()
+        assert first == "plain text"
+        assert json.loads(second)["message"] == "caf\u00e9"
+    
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork not available")
+    def test_forked_child_logs_written(self):
+        """Test a forked child writes its records through its own listener."""
+        code = (
+            "import os, sys\n"
+            "from src.utils.logging import get_logger\n"
+            "before = get_logger('morphix.test.before')\n"
+            "before.info('parent')\n"
+            "pid = os.fork()\n"
+            "if pid == 0:\n"
+            "    before.info('child before')\n"
+            "    get_logger('morphix.test.after').info('child after')\n"
+            "    sys.exit(0)\n"
+            "os.waitpid(pid, 0)\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=project_root, check=True,
+            capture_output=True, text=True
+        ).stderr
+        
+        messages = [json.loads(line)["message"] for line in output.splitlines()]
+        assert sorted(messages) == ["child after", "child before", "parent"]
+
+
+class TestLogJson:
+    """Test cases for the log_json helper."""
+    
+    def test_fields_attached(self):
+        """Test fields reach the record as extra_fields with the caller's location."""
+        logger = MagicMock(spec=logging.Logger)
+        logger.isEnabledFor.return_value = True
+        
+        morphix_logging.log_json(logger, logging.INFO, "saved", collection="users")
+        
+        logger.log.assert_called_once_with(
+            logging.INFO, "saved", extra={"extra_fields": {"collection": "users"}}, stacklevel=2
+        )
+    
+    def test_disabled_level_skipped(self):
+        """Test nothing is logged when the level is disabled."""
+        logger = MagicMock(spec=logging.Logger)
+        logger.isEnabledFor.return_value = False
+        
+        morphix_logging.log_json(logger, logging.DEBUG, "noisy", rows=10)
+        
+        logger.log.assert_not_called()
+    
+    def test_record_location_is_caller(self):
+        """Test the record points at the log_json call site, not the helper."""
+        logger = logging.getLogger("morphix.test.log_json")
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        logger.addHandler(handler)
+        try:
+            morphix_logging.log_json(logger, logging.WARNING, "here", step=1)
+        finally:
+            logger.removeHandler(handler)
+        
+        assert records[0].funcName == "test_record_location_is_caller"
+        assert records[0].extra_fields == {"step": 1}
+
+
+class TestCorrelationId:
+    """Test cases for correlation ID helpers."""
+    
+    def test_generated_ids(self):
+        """Test generated IDs are unique and keep the UUID layout."""
+        with CorrelationContext() as first, CorrelationContext(inherit_if_present=False) as second:
+            assert first != second
+            assert morphix_logging.get_correlation_id() == second
+        
+        assert re.fullmatch(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", first)
+        assert morphix_logging.get_correlation_id() is None
+    
+    def test_nested_context_inherits(self):
+        """Test a nested context without an ID keeps the outer one."""
+        with CorrelationContext("outer"):
+            with CorrelationContext() as inner:
+                assert inner == "outer"
+            with CorrelationContext("explicit") as explicit:
+                assert explicit == "explicit"
+            assert morphix_logging.get_correlation_id() == "outer"
+    
+    def test_thread_local_backend(self):
+        """Test MORPHIX_USE_CONTEXTVAR=0 keeps IDs per thread."""
+        code = (
+            "import threading\n"
+            "from src.utils import logging as l\n"
+            "assert not l._USE_CONTEXTVAR\n"
+            "seen = []\n"
+            "with l.CorrelationContext('main'):\n"
+            "    t = threading.Thread(target=lambda: seen.append(l.get_correlation_id()))\n"
+            "    t.start(); t.join()\n"
+            "    print(l.get_correlation_id(), seen[0])\n"
+            "print(l.get_correlation_id())\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=project_root, check=True,
+            capture_output=True, text=True, env={**os.environ, "MORPHIX_USE_CONTEXTVAR": "0"}
+        ).stdout
+        assert output.split() == ["main", "None", "None"]
+    
+    def test_context_has_no_instance_dict(self):
+        """Test CorrelationContext instances use slots."""
+        assert not hasattr(CorrelationContext("cid"), "__dict__")
+
+
+class TestFormatTimestamp:
+    """Test cases for the cached timestamp formatter."""
+    
+    def test_matches_datetime(self):
+        """Test output agrees with datetime for times inside one second."""
+        for created in (1_700_000_000.0, 1_700_000_000.25, 1_700_000_000.999999, 1_700_000_001.5):
+            expected = datetime.fromtimestamp(created, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+            assert morphix_logging._format_timestamp(created) == expected
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,246 @@
+"""
+Unit tests for transform plan manager.
+"""
+
+import pytest
+import errno
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.transform_plans import plan_manager
+from src.transform_plans.plan_manager import PlanManager
+
+
+OPERATIONS = [
+    {"type": "add_field", "field": "email"},
+    {"type": "type_conversion", "field": "age", "original_type": "string", "target_type": "int"},
+    {"type": "fill_null", "field": "name"},
+]
+
+
+class TestPlanManager:
+    """Test cases for PlanManager class."""
+    
+    @pytest.fixture
+    def manager(self, tmp_path):
+        """Create plan manager rooted in a temporary metadata directory."""
+        return PlanManager(tmp_path)
+    
+    def test_create_and_get_plan(self, manager):
+        """Test creating a plan and reading it back."""
+        plan = manager.create_plan("users", "in_hash", "out_hash", OPERATIONS)
+        
+        assert plan["version"] == 1
+        assert plan["approved"] is False
+        assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}Z", plan["created_at"])
+        assert [op["type"] for op in plan["rollback_plan"]] == [
+            "set_null", "type_conversion", "remove_field"
+        ]
+        
+        assert re.fullmatch(r"[0-9a-f]{16}", plan["plan_id"])
+        
+        loaded = manager.get_plan("users", 1)
+        assert loaded["plan_id"] == plan["plan_id"]
+        assert list(loaded["operations"]) == OPERATIONS
+        assert manager.get_plan("users", 99) is None
+    
+    def test_rollback_plan(self, manager):
+        """Test inverse operations are generated newest first."""
+        rollback = manager._generate_rollback_plan({"operations": [
+            {"type": "remove_field", "field": "legacy", "original_value": 0},
+            {"type": "rename_field", "field": "a"},
+            {"type": "type_conversion", "field": "age", "original_type": "string", "target_type": "int"},
+        ]})
+        
+        assert rollback == [
+            {"type": "type_conversion", "field": "age", "target_type": "string", "original_type": "int"},
+            {"type": "add_field", "field": "legacy", "default_value": 0},
+        ]
+    
+    def test_versions_increment(self, manager):
+        """Test versions auto-increment and list_plans is newest first."""
+        for _ in range(3):
+            manager.create_plan("users", "in_hash", "out_hash", OPERATIONS)
+        
+        plans = manager.list_plans("users")
+        assert [p["version"] for p in plans] == [3, 2, 1]
+        assert manager.list_plan_versions("users") == [3, 2, 1]
+        assert manager.list_plans("unknown") == []
+        assert manager.list_plan_versions("unknown") == []
+    
+    def test_next_version_from_existing_files(self, manager):
+        """Test a fresh manager continues numbering from files on disk."""
+        manager.create_plan("users", "in_hash", "out_hash", OPERATIONS)
+        manager.create_plan("users", "in_hash", "out_hash", OPERATIONS, version=5)
+        
+        fresh = PlanManager(manager.metadata_base)
+        assert fresh.create_plan("users", "in_hash", "out_hash", OPERATIONS)["version"] == 6
+    
+    def test_stale_counter_does_not_overwrite(self, manager):
+        """Test two managers on one directory never reuse a version."""
+        other = PlanManager(manager.metadata_base)
+        manager.create_plan("users", "in_hash", "out_hash", OPERATIONS)
+        other.create_plan("users", "other_in", "other_out", OPERATIONS)
+        
+        # manager's counter still says 1 was the last version
+        plan = manager.create_plan("users", "in_hash", "out_hash", OPERATIONS)
+        
+        assert plan["version"] == 3
+        assert manager.list_plan_versions("users") == [3, 2, 1]
+        assert PlanManager(manager.metadata_base).get_plan("users", 2)["input_schema_hash"] == "other_in"
+        assert not [p for p in (manager.plans_dir / "users").iterdir() if p.suffix == ".tmp"]
+    
+    def test_exclusive_write_without_hard_links(self, manager, monkeypatch):
+        """Test new versions are still claimed exclusively when os.link is unsupported."""
+        def no_link(src, dst):
+            raise PermissionError(errno.EPERM, "Operation not permitted")
+        
+        monkeypatch.setattr(os, "link", no_link)
+        other = PlanManager(manager.metadata_base)
+        manager.create_plan("users", "in_hash", "out_hash", OPERATIONS)
+        other.create_plan("users", "other_in", "other_out", OPERATIONS)
+        plan = manager.create_plan("users", "in_hash", "out_hash", OPERATIONS)
+        
+        assert plan["version"] == 3
+        assert PlanManager(manager.metadata_base).get_plan("users", 2)["input_schema_hash"] == "other_in"
+        assert not [p for p in (manager.plans_dir / "users").iterdir() if p.suffix == ".tmp"]
+    
+    def test_list_plans_parallel(self, manager):
+        """Test large listings read concurrently keep newest-first order."""
+        count = 20
+        for _ in range(count):
+            manager.create_plan("users", "in_hash", "out_hash", OPERATIONS)
+        manager.mark_plan_applied("users", 3)
+        
+        plans = PlanManager(manager.metadata_base).list_plans("users")
+        assert [p["version"] for p in plans] == list(range(count, 0, -1))
+        assert [p["version"] for p in plans if p["applied"]] == [3]
+    
+    def test_approve_and_mark_applied(self, manager):
+        """Test status transitions are persisted."""
+        manager.create_plan("users", "in_hash", "out_hash", OPERATIONS)
+        
+        assert manager.approve_plan("users", 1, "alice") is True
+        assert manager.mark_plan_applied("users", 1) is True
+        assert manager.approve_plan("users", 2, "alice") is False
+        
+        plan = PlanManager(manager.metadata_base).get_plan("users", 1)
+        assert plan["approved"] is True
+        assert plan["approved_by"] == "alice"
+        assert plan["applied"] is True
+        assert "applied_at" in plan
+        
+        # Status lives in side-car files; the plan body is never rewritten
+        plan_dir = manager.plans_dir / "users"
+        assert PlanManager(manager.metadata_base)._load_plan_file(
+            manager._find_plan_file("users", 1)
+        )["approved"] is False
+        assert json.loads((plan_dir / "1.status.json").read_text())["approved_by"] == "alice"
+        applied_log = (plan_dir / "applied.jsonl").read_text().splitlines()
+        assert [json.loads(line)["version"] for line in applied_log] == [1]
+        assert manager.list_plan_versions("users") == [1]
+        assert manager.list_plans("users")[0]["applied"] is True
+    
+    def test_applied_log_skips_torn_line(self, manager):
+        """Test a partially appended log line does not break reads."""
+        manager.create_plan("users", "in_hash", "out_hash", OPERATIONS)
+        manager.create_plan("users", "in_hash", "out_hash", OPERATIONS)
+        manager.mark_plan_applied("users", 1)
+        with open(manager.plans_dir / "users" / "applied.jsonl", "a") as f:
+            f.write('{"plan_id": "x", "vers')
+        
+        plans = {p["version"]: p for p in manager.list_plans("users")}
+        assert plans[1]["applied"] is True
+        assert plans[2]["applied"] is False
+    
+    def test_failed_write_keeps_previous_plan(self, manager, monkeypatch):
+        """Test an interrupted write leaves the old file and no temp files."""
+        manager.create_plan("users", "in_hash", "out_hash", OPERATIONS)
+        
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+        
+        monkeypatch.setattr(os, "replace", fail_replace)
+        assert manager.approve_plan("users", 1, "alice") is False
+        monkeypatch.undo()
+        
+        plan_files = sorted(p.name for p in (manager.plans_dir / "users").iterdir())
+        assert plan_files == [manager._find_plan_file("users", 1).name]
+        assert PlanManager(manager.metadata_base).get_plan("users", 1)["approved"] is False
+    
+    def test_plan_view_is_read_only(self, manager):
+        """Test the cache-sharing view cannot be mutated."""
+        manager.create_plan("users", "in_hash", "out_hash", OPERATIONS)
+        
+        view = manager.get_plan_view("users", 1)
+        with pytest.raises(TypeError):
+            view["approved"] = True
+        assert isinstance(view["operations"], tuple)
+        assert manager.get_plan_view("users", 99) is None
+    
+    def test_get_plan_returns_plain_copy(self, manager):
+        """Test get_plan returns a JSON-serializable dict callers may modify."""
+        manager.create_plan("users", "in_hash", "out_hash", OPERATIONS)
+        
+        plan = manager.get_plan("users", 1)
+        assert type(plan) is dict
+        assert json.loads(json.dumps(plan)) == plan
+        assert plan["operations"] == OPERATIONS
+        
+        plan["approved"] = True
+        plan["operations"][0]["field"] = "changed"
+        plan["operations"].append({"type": "fill_null", "field": "x"})
+        again = manager.get_plan("users", 1)
+        assert again["approved"] is False
+        assert again["operations"] == OPERATIONS
+        assert type(manager.list_plans("users")[0]["operations"]) is list
+    
+    def test_cache_sees_external_rewrite(self, manager):
+        """Test a plan rewritten outside the manager is re-read."""
+        manager.create_plan("users", "in_hash", "out_hash", OPERATIONS)
+        manager.get_plan("users", 1)
+        
+        plan_file = manager._find_plan_file("users", 1)
+        data = dict(manager._load_plan_file(plan_file))
+        data["output_schema_hash"] = "rewritten_hash"
+        PlanManager(manager.metadata_base)._write_plan(plan_file, data)
+        stat = os.stat(plan_file)
+        os.utime(plan_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        
+        assert manager.get_plan("users", 1)["output_schema_hash"] == "rewritten_hash"
+
+    
+    def test_plans_stored_compressed(self, manager):
+        """Test new plan bodies are written as zstd files."""
+        if not plan_manager.ZSTD_AVAILABLE:
+            pytest.skip("zstandard not installed")
+        manager.create_plan("users", "in_hash", "out_hash", OPERATIONS)
+        
+        plan_file = manager.plans_dir / "users" / "1.json.zst"
+        assert plan_file.exists()
+        assert plan_file.read_bytes()[:4] == b"\x28\xb5\x2f\xfd"
+    
+    def test_plain_json_plans_still_read(self, manager):
+        """Test plans written as plain .json by older releases load."""
+        plan_dir = manager.plans_dir / "users"
+        plan_dir.mkdir(parents=True)
+        (plan_dir / "1.json").write_text(json.dumps({
+            "plan_id": "legacy", "version": 1, "operations": OPERATIONS,
+            "approved": False, "applied": False
+        }))
+        
+        assert manager.get_plan("users", 1)["plan_id"] == "legacy"
+        assert manager.approve_plan("users", 1, "alice") is True
+        assert manager.create_plan("users", "in_hash", "out_hash", OPERATIONS)["version"] == 2
+        assert [p["version"] for p in manager.list_plans("users")] == [2, 1]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
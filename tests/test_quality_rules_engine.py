@@ -5,6 +5,7 @@ Unit tests for data quality rules engine.
 import pytest
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 from datetime import datetime, timedelta
 import sys
 from pathlib import Path
@@ -13,12 +14,14 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.quality import rules_engine
 from src.quality.rules_engine import (
     QualityRulesEngine,
     QualityRule,
     RuleType,
     QualityResult
 )
+from src.quality.rule_templates import RULE_TEMPLATES
 
 
 class TestQualityRulesEngine:
@@ -184,6 +187,72 @@ class TestQualityRulesEngine:
         assert result.passed is False
         assert result.failed_count == 2
     
+    def test_pattern_match_rule_arrow_and_mixed(self):
+        """Test pattern match on Arrow-backed and mixed-type columns."""
+        engine = QualityRulesEngine()
+        rule = QualityRule(
+            rule_id="email_format",
+            rule_type=RuleType.PATTERN_MATCH,
+            column="email",
+            parameters={"pattern": r'[a-z]+@[a-z]+\.com'},
+            severity="error"
+        )
+        
+        arrow_df = pd.DataFrame({
+            'email': pd.Series(
+                ['alice@example.com', 'x alice@example.com', None],
+                dtype=pd.ArrowDtype(pa.string())
+            )
+        })
+        result = engine._execute_rule(arrow_df, rule)
+        assert result.failed_count == 1
+        assert result.total_count == 2
+        
+        mixed_df = pd.DataFrame({'email': ['alice@example.com', 42]})
+        result = engine._execute_rule(mixed_df, rule)
+        assert result.failed_count == 1
+        assert result.failed_values == [42]
+    
+    def test_pattern_match_built_in(self):
+        """Test pattern match rule referencing a built-in pattern by name."""
+        engine = QualityRulesEngine()
+        df = pd.DataFrame({
+            'phone': ['+1 (555) 123-4567', 'call me', None, '5551234567']
+        })
+        
+        rule = QualityRule(
+            rule_id="phone_format",
+            rule_type=RuleType.PATTERN_MATCH,
+            column="phone",
+            parameters={"built_in_name": "phone_format"},
+            severity="warning"
+        )
+        
+        result = engine._execute_rule(df, rule)
+        assert result.passed is False
+        assert result.failed_count == 1
+        assert result.total_count == 3
+        assert result.failed_values == ['call me']
+    
+    def test_pattern_match_template_uses_built_in_matcher(self, monkeypatch):
+        """Test template rules spelling out a built-in pattern use its matcher."""
+        engine = QualityRulesEngine()
+        df = pd.DataFrame({'email': ['alice@example.com', 'not-an-email']})
+        rule = RULE_TEMPLATES["email_validation"]
+        pattern = rule.parameters["pattern"]
+        
+        calls = []
+        matcher = rules_engine._BUILT_IN_MATCHERS[pattern]
+        monkeypatch.setitem(
+            rules_engine._BUILT_IN_MATCHERS, pattern,
+            lambda values: calls.append(len(values)) or matcher(values)
+        )
+        
+        result = engine._execute_rule(df, rule)
+        assert calls == [2]
+        assert result.failed_count == 1
+        assert result.failed_values == ['not-an-email']
+    
     def test_uniqueness_rule_pass(self):
         """Test uniqueness rule that passes."""
         engine = QualityRulesEngine()
@@ -221,6 +290,28 @@ class TestQualityRulesEngine:
         assert result.passed is False
         assert result.failed_count == 2
     
+    def test_uniqueness_rule_approximate(self):
+        """Test approximate uniqueness rule on a large column."""
+        engine = QualityRulesEngine()
+        df = pd.DataFrame({
+            'id': np.concatenate([np.arange(50000), np.arange(5000)])
+        })
+        
+        rule = QualityRule(
+            rule_id="id_uniqueness",
+            rule_type=RuleType.UNIQUENESS,
+            column="id",
+            parameters={"approximate": True},
+            severity="error"
+        )
+        
+        result = engine._execute_rule(df, rule)
+        assert result.passed is False
+        assert result.total_count == 55000
+        # HyperLogLog standard error is ~0.8% of the distinct count
+        assert abs(result.failed_count - 5000) < 1500
+        assert "approximate" in result.message
+    
     def test_freshness_rule_pass(self):
         """Test freshness rule that passes."""
         engine = QualityRulesEngine()
@@ -308,6 +399,81 @@ class TestQualityRulesEngine:
         assert results[1].passed is True   # Age completeness passes
         assert results[2].passed is False  # Score range fails
     
+    def test_apply_rules_same_column(self):
+        """Test several rules sharing one column reuse the staged arrays."""
+        engine = QualityRulesEngine()
+        df = pd.DataFrame({
+            'email': ['alice@example.com', None, 'invalid', 'alice@example.com']
+        })
+        
+        rules = [
+            QualityRule(
+                rule_id="email_completeness",
+                rule_type=RuleType.NULL_THRESHOLD,
+                column="email",
+                parameters={"max_null_percent": 10},
+                severity="warning"
+            ),
+            QualityRule(
+                rule_id="email_format",
+                rule_type=RuleType.PATTERN_MATCH,
+                column="email",
+                parameters={"pattern": r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'},
+                severity="error"
+            ),
+            QualityRule(
+                rule_id="email_uniqueness",
+                rule_type=RuleType.UNIQUENESS,
+                column="email",
+                parameters={},
+                severity="error"
+            )
+        ]
+        
+        results = engine.apply_rules(df, rules)
+        
+        assert [r.passed for r in results] == [False, False, False]
+        assert results[0].failed_count == 1
+        assert results[1].failed_count == 1
+        assert results[1].failed_values == ['invalid']
+        assert results[2].failed_count == 1
+        
+        cache = {}
+        values, null_mask, non_null = engine._column_arrays(df, 'email', cache)
+        assert cache['email'][1] is null_mask
+        assert null_mask.tolist() == [False, True, False, False]
+        assert len(non_null) == 3
+    
+    def test_result_and_rule_models(self):
+        """Test result carriers are slotted and rules are frozen."""
+        result = QualityResult(
+            rule_id="rule1",
+            passed=True,
+            severity="info",
+            message="Passed",
+            failed_count=0,
+            total_count=10
+        )
+        assert not hasattr(result, '__dict__')
+        assert result.failed_values == []
+        
+        rule = QualityRule(
+            rule_id="rule1",
+            rule_type=RuleType.NULL_THRESHOLD,
+            column="col",
+            parameters={}
+        )
+        with pytest.raises(Exception):
+            rule.column = "other"
+        with pytest.raises(Exception):
+            QualityRule(
+                rule_id="rule2",
+                rule_type=RuleType.NULL_THRESHOLD,
+                column="col",
+                parameters={},
+                unexpected="value"
+            )
+    
     def test_calculate_quality_score(self):
         """Test quality score calculation."""
         engine = QualityRulesEngine()
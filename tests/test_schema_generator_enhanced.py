@@ -79,6 +79,27 @@ class TestSchemaGeneratorEnhanced:
         nested_suggestions = [s for s in suggestions if 'metadata' in s['field']]
         assert len(nested_suggestions) > 0
     
+    def test_generate_from_documents(self):
+        """Test schema inference straight from documents matches the DataFrame path."""
+        docs = [
+            {'id': 1, 'name': 'a', 'price': 1.5, 'tags': ['x'], 'meta': {'k': 1}},
+            {'id': 2, 'name': None, 'price': 2, 'active': True},
+        ]
+        
+        schema = SchemaGenerator.generate_from_documents(docs)
+        frame_schema = SchemaGenerator.generate_from_dataframe(pd.DataFrame(docs[:1]))
+        
+        assert {f: s['type'] for f, s in schema.items()} == {
+            'id': 'integer', 'name': 'string', 'price': 'float',
+            'tags': 'array', 'meta': 'object', 'active': 'boolean'
+        }
+        assert [f for f, s in schema.items() if s['nullable']] == ['name', 'tags', 'meta', 'active']
+        
+        single = SchemaGenerator.generate_from_documents(docs[:1])
+        assert {f: s['type'] for f, s in single.items()} == {
+            f: s['type'] for f, s in frame_schema.items()
+        }
+    
     def test_detect_breaking_changes_type_change(self):
         """Test detection of breaking type changes."""
         old_schema = {
@@ -0,0 +1,346 @@
+"""
+Unit tests for Trino client.
+"""
+
+import pytest
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+from pydantic import ValidationError
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.trino import client as trino_client
+from src.trino.client import TrinoClient, TrinoError, TrinoQueryResult
+from src.trino.models import TrinoConfig, TrinoTableInfo
+
+pytestmark = pytest.mark.skipif(
+    not trino_client.TRINO_AVAILABLE, reason="trino library not installed"
+)
+
+
+@pytest.fixture
+def mock_connect():
+    """Patch trino.dbapi.connect and start every test with an empty pool."""
+    trino_client.close_pooled_connections()
+    trino_client._METADATA_CACHE.clear()
+    with patch("trino.dbapi.connect") as connect:
+        connect.side_effect = lambda **kwargs: MagicMock(name="connection")
+        yield connect
+    trino_client.close_pooled_connections()
+    trino_client._METADATA_CACHE.clear()
+
+
+def test_trino_imported_lazily():
+    """Test importing the client module does not import the trino library."""
+    code = "import sys, src.trino.client; print('trino' in sys.modules)"
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=project_root,
+        capture_output=True, text=True, check=True
+    ).stdout
+    assert output.strip() == "False"
+
+
+class TestTrinoClientPool:
+    """Test cases for TrinoClient connection pooling."""
+    
+    def test_connection_reused_after_close(self, mock_connect):
+        """Test a closed client's connection is handed to the next client."""
+        first = TrinoClient(TrinoConfig())
+        connection = first.connection
+        first.close()
+        
+        second = TrinoClient(TrinoConfig())
+        assert second.connection is connection
+        assert mock_connect.call_count == 1
+        connection.close.assert_not_called()
+    
+    def test_pool_keyed_by_config(self, mock_connect):
+        """Test clients with different configs do not share connections."""
+        with TrinoClient(TrinoConfig(catalog="hive")):
+            pass
+        
+        other = TrinoClient(TrinoConfig(catalog="iceberg"))
+        assert mock_connect.call_count == 2
+        other.close()
+    
+    def test_pool_overflow_closes_connection(self, mock_connect):
+        """Test connections beyond the pool size are really closed."""
+        clients = [TrinoClient(TrinoConfig()) for _ in range(trino_client.MAX_POOL_SIZE + 1)]
+        connections = [c.connection for c in clients]
+        for c in clients:
+            c.close()
+        
+        connections[-1].close.assert_called_once()
+        for connection in connections[:-1]:
+            connection.close.assert_not_called()
+    
+    def test_stale_connection_replaced(self, mock_connect):
+        """Test an idle connection that fails its ping is discarded."""
+        first = TrinoClient(TrinoConfig())
+        stale = first.connection
+        stale.cursor.return_value.execute.side_effect = Exception("gone")
+        first.close()
+        
+        with patch.object(trino_client, "POOL_PING_IDLE_SECONDS", -1):
+            second = TrinoClient(TrinoConfig())
+        
+        assert second.connection is not stale
+        stale.close.assert_called_once()
+        second.close()
+    
+    def test_connection_closed_after_user_sql(self, mock_connect):
+        """Test a connection that ran user SQL is not handed to the next client."""
+        first = TrinoClient(TrinoConfig())
+        connection = first.connection
+        connection.cursor.return_value.description = None
+        connection.cursor.return_value.fetchmany.return_value = []
+        first.execute_query("USE hive.analytics")
+        first.close()
+        
+        connection.close.assert_called_once()
+        second = TrinoClient(TrinoConfig())
+        assert second.connection is not connection
+        second.close()
+    
+    def test_connection_closed_on_error_exit(self, mock_connect):
+        """Test a client leaving its context on an exception closes the connection."""
+        with pytest.raises(RuntimeError):
+            with TrinoClient(TrinoConfig()) as client:
+                connection = client.connection
+                raise RuntimeError("boom")
+        
+        connection.close.assert_called_once()
+        with TrinoClient(TrinoConfig()) as other:
+            assert other.connection is not connection
+
+
+
+class TestTrinoClientQuery:
+    """Test cases for TrinoClient query execution."""
+    
+    def test_execute_query(self, mock_connect):
+        """Test rows and columns are returned from the cursor."""
+        client = TrinoClient(TrinoConfig())
+        cursor = client.connection.cursor.return_value
+        cursor.description = [("id",), ("name",)]
+        cursor.fetchmany.return_value = [[1, "a"], [2, "b"]]
+        
+        result = client.execute_query("SELECT id, name FROM t", max_rows=10)
+        
+        cursor.fetchmany.assert_called_once_with(10)
+        assert result.success is True
+        assert result.rows_returned == 2
+        assert list(result.columns) == ["id", "name"]
+        assert result.to_records() == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+        assert result.to_columns() == {"id": [1, 2], "name": ["a", "b"]}
+        client.close()
+    
+    def test_execute_query_iter(self, mock_connect):
+        """Test results are streamed in fetchmany batches."""
+        client = TrinoClient(TrinoConfig())
+        cursor = client.connection.cursor.return_value
+        cursor.fetchmany.side_effect = [[[1], [2]], [[3]], []]
+        
+        batches = list(client.execute_query_iter("SELECT id FROM t", batch_size=2))
+        
+        assert batches == [[[1], [2]], [[3]]]
+        client.close()
+
+
+    
+    def test_identifiers_quoted(self, mock_connect):
+        """Test catalog/schema/table names are quoted in metadata queries."""
+        client = TrinoClient(TrinoConfig())
+        cursor = client.connection.cursor.return_value
+        cursor.fetchall.return_value = []
+        
+        client.list_tables(catalog="hive", schema='x"; DROP TABLE t; --')
+        client.describe_table("orders", catalog="hive", schema="default")
+        
+        statements = [c.args[0] for c in cursor.execute.call_args_list]
+        assert statements == [
+            'SHOW TABLES FROM "hive"."x""; DROP TABLE t; --"',
+            'DESCRIBE "hive"."default"."orders"'
+        ]
+        client.close()
+
+
+
+class TestTrinoQueryResult:
+    """Test cases for TrinoQueryResult conversions."""
+    
+    def test_columns_interned(self):
+        """Test results with the same columns share one tuple and no __dict__."""
+        first = TrinoQueryResult("SELECT 1", ["a", "b"], [], 0, 1.0)
+        second = TrinoQueryResult("SELECT 2", ["a", "b"], [], 0, 1.0)
+        
+        assert first.columns == ("a", "b")
+        assert first.columns is second.columns
+        assert not hasattr(first, "__dict__")
+    
+    def test_to_columns_empty(self):
+        """Test an empty result still has every column."""
+        result = TrinoQueryResult("SELECT 1", ["a", "b"], [], 0, 1.0)
+        assert result.to_columns() == {"a": [], "b": []}
+    
+    def test_to_arrow(self):
+        """Test conversion to a pyarrow Table."""
+        pa = pytest.importorskip("pyarrow")
+        result = TrinoQueryResult("SELECT 1", ["a", "b"], [[1, "x"], [2, "y"]], 2, 1.0)
+        table = result.to_arrow()
+        assert isinstance(table, pa.Table)
+        assert table.column_names == ["a", "b"]
+        assert table.column("a").to_pylist() == [1, 2]
+
+
+class TestTrinoModels:
+    """Test cases for the Trino pydantic models."""
+    
+    def test_config_frozen(self):
+        """Test configs cannot be changed after construction."""
+        config = TrinoConfig(catalog="iceberg")
+        with pytest.raises(ValidationError):
+            config.catalog = "hive"
+    
+    def test_unknown_fields_rejected(self):
+        """Test misspelled fields raise instead of being dropped."""
+        with pytest.raises(ValidationError):
+            TrinoConfig(hostname="trino")
+    
+    def test_metadata_rows_not_revalidated(self, mock_connect):
+        """Test metadata built from server rows keeps row values as-is."""
+        client = TrinoClient(TrinoConfig())
+        cursor = client.connection.cursor.return_value
+        cursor.fetchall.return_value = [["orders", "BASE TABLE"]]
+        
+        tables = client.list_tables(catalog="hive", schema="default")
+        
+        assert tables == [TrinoTableInfo(
+            catalog="hive", schema="default", table="orders", table_type="BASE TABLE"
+        )]
+        client.close()
+
+
+class TestTrinoClientMetadataCache:
+    """Test cases for the metadata TTL cache."""
+    
+    def test_list_tables_cached_across_clients(self, mock_connect):
+        """Test repeated listings within the TTL skip the round-trip."""
+        client = TrinoClient(TrinoConfig())
+        cursor = client.connection.cursor.return_value
+        cursor.fetchall.return_value = [["orders"]]
+        
+        first = client.list_tables(catalog="hive", schema="default")
+        client.close()
+        with TrinoClient(TrinoConfig()) as other:
+            second = other.list_tables(catalog="hive", schema="default")
+        
+        assert [t.table for t in first] == [t.table for t in second] == ["orders"]
+        assert cursor.execute.call_count == 1
+    
+    def test_cache_expires(self, mock_connect):
+        """Test entries are refreshed once the TTL has passed."""
+        client = TrinoClient(TrinoConfig())
+        cursor = client.connection.cursor.return_value
+        cursor.fetchall.return_value = [["hive", "hive"]]
+        
+        client.list_catalogs()
+        with patch.object(trino_client.time, "monotonic", return_value=time.monotonic() + 3600):
+            client.list_catalogs()
+        
+        assert cursor.execute.call_count == 2
+        client.close()
+    
+    def test_refresh_bypasses_cache(self, mock_connect):
+        """Test refresh=True queries the server even with a live entry."""
+        client = TrinoClient(TrinoConfig())
+        cursor = client.connection.cursor.return_value
+        cursor.fetchall.return_value = [["hive", "hive"]]
+        
+        client.list_catalogs()
+        assert len(client.list_catalogs(refresh=True)) == 1
+        assert cursor.execute.call_count == 2
+        
+        # A server that went away is reported, not masked by the cache
+        cursor.execute.side_effect = Exception("connection refused")
+        with pytest.raises(TrinoError):
+            client.list_catalogs(refresh=True)
+        client.close()
+    
+    def test_cache_size_bounded(self, mock_connect):
+        """Test distinct keys beyond the limit evict the oldest entries."""
+        client = TrinoClient(TrinoConfig())
+        cursor = client.connection.cursor.return_value
+        cursor.fetchall.return_value = [["id", "bigint"]]
+        
+        with patch.object(trino_client, "METADATA_CACHE_MAX_ENTRIES", 3):
+            for i in range(5):
+                client.describe_table(f"table_{i}", catalog="hive", schema="default")
+            assert len(trino_client._METADATA_CACHE) == 3
+            
+            # Newest entries are still served from the cache
+            client.describe_table("table_4", catalog="hive", schema="default")
+            assert cursor.execute.call_count == 5
+            client.describe_table("table_0", catalog="hive", schema="default")
+            assert cursor.execute.call_count == 6
+        client.close()
+    
+    def test_cache_sweeps_expired_when_full(self, mock_connect):
+        """Test expired entries are dropped before live ones when the cache fills."""
+        client = TrinoClient(TrinoConfig())
+        cursor = client.connection.cursor.return_value
+        cursor.fetchall.return_value = [["hive", "hive"]]
+        
+        with patch.object(trino_client, "METADATA_CACHE_MAX_ENTRIES", 2):
+            client.list_catalogs()
+            client.list_schemas(catalog="hive")
+            later = time.monotonic() + trino_client.METADATA_CACHE_TTL_SECONDS + 1
+            with patch.object(trino_client.time, "monotonic", return_value=later):
+                client.describe_table("orders", catalog="hive", schema="default")
+            assert [key[1] for key in trino_client._METADATA_CACHE] == ["describe_table"]
+        client.close()
+    
+    def test_ddl_invalidates_cache(self, mock_connect):
+        """Test DDL through execute_query clears cached metadata."""
+        client = TrinoClient(TrinoConfig())
+        cursor = client.connection.cursor.return_value
+        cursor.fetchall.return_value = [["default"]]
+        cursor.fetchmany.return_value = []
+        cursor.description = None
+        
+        client.list_schemas(catalog="hive")
+        client.execute_query("CREATE SCHEMA hive.analytics")
+        client.list_schemas(catalog="hive")
+        
+        assert cursor.execute.call_count == 3
+        client.close()
+    
+    def test_ddl_invalidates_other_configs(self, mock_connect):
+        """Test DDL from a client with overrides clears entries cached by others."""
+        client = TrinoClient(TrinoConfig())
+        cursor = client.connection.cursor.return_value
+        cursor.fetchall.return_value = [["default"]]
+        client.list_schemas(catalog="hive")
+        client.close()
+        
+        other_server = TrinoClient(TrinoConfig(host="other-trino"))
+        other_server.connection.cursor.return_value.fetchall.return_value = [["default"]]
+        other_server.list_schemas(catalog="hive")
+        other_server.close()
+        
+        with TrinoClient(TrinoConfig(catalog="iceberg", schema="analytics")) as ddl_client:
+            ddl_cursor = ddl_client.connection.cursor.return_value
+            ddl_cursor.fetchmany.return_value = []
+            ddl_cursor.description = None
+            ddl_client.execute_query("CREATE SCHEMA hive.analytics")
+        
+        assert [key[0][0] for key in trino_client._METADATA_CACHE] == ["other-trino"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])